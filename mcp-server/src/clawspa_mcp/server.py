@@ -3,29 +3,60 @@ from __future__ import annotations
 """MCP bridge that forwards validated tool calls to the local runner API."""
 
 import argparse
+import functools
 import ipaddress
 import json
+import os
 import re
 import sys
-import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode, urlsplit
-from urllib.request import Request, urlopen
+from http.client import HTTPConnection, HTTPException, HTTPSConnection, RemoteDisconnected
+from typing import Any, Callable, Iterator
+from urllib.parse import SplitResult, urlencode, urlsplit
 
-from clawspa_runner.security import payload_contains_pii, payload_contains_secrets, payload_requests_raw_logs
+from clawspa_runner.security import SENSITIVE_TEXT_PATTERN, classify_sensitive_text
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json fallback
+    orjson = None  # type: ignore[assignment]
 
-QUEST_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9._-]{2,159}$")
-DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+QUEST_ID_PATTERN = re.compile(r"[a-z0-9][a-z0-9._-]{2,159}")
 MAX_ARTIFACTS = 8
 MAX_STRING_LENGTH = 1024
 MAX_PROFILE_PATCH_BYTES = 8 * 1024
 MAX_ARTIFACT_REF_CHARS = 128
 MAX_ARTIFACT_SUMMARY_CHARS = 4000
-ARTIFACT_REF_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9 ._:-]{0,127}$")
-
+REQUEST_TIMEOUT_SECONDS = 10
+# A reused keep-alive socket the server closed before responding; timeouts are never retried.
+STALE_CONNECTION_ERRORS = (RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+RETRYABLE_METHODS = frozenset({"GET", "HEAD"})
+MAX_IDLE_CONNECTIONS = 8
+STATIC_REQUEST_HEADERS = {
+    "Content-Type": "application/json",
+    "X-Clawspa-Source": "mcp",
+    "X-Clawspa-Actor": "agent",
+}
+PROFILE_PATHS = {
+    "human": "/v1/profiles/human",
+    "agent": "/v1/profiles/agent",
+    "alignment_snapshot": "/v1/profiles/alignment_snapshot",
+}
+ARTIFACT_REF_PATTERN = re.compile(rf"[A-Za-z0-9][A-Za-z0-9 ._:-]{{0,{MAX_ARTIFACT_REF_CHARS - 1}}}")
+PROOF_TIERS = frozenset({"P0", "P1", "P2", "P3"})
+FEEDBACK_SEVERITIES = frozenset({"info", "low", "medium", "high", "critical"})
+FEEDBACK_COMPONENTS = frozenset({"proofs", "planner", "api", "mcp", "telemetry", "quests", "docs", "other"})
+FEEDBACK_LINK_KEYS = frozenset({"quest_id", "proof_id", "endpoint", "commit", "pr"})
+IDENTITY_ARGUMENT_KEYS = frozenset({"actor_id", "trace_id"})
+FEEDBACK_SUMMARY_ARGUMENT_KEYS = IDENTITY_ARGUMENT_KEYS | {"range"}
+
+
+# Shared, read-only schema fragments; they serialize identically wherever they are reused.
+_STRING_SCHEMA = {"type": "string"}
+_IDENTITY_PROPERTIES = {"actor_id": _STRING_SCHEMA, "trace_id": _STRING_SCHEMA}
 
 TOOL_SCHEMAS = [
     {
@@ -33,7 +64,7 @@ TOOL_SCHEMAS = [
         "description": "Get daily quest plan for a date (defaults to today).",
         "input_schema": {
             "type": "object",
-            "properties": {"date": {"type": "string"}, "actor_id": {"type": "string"}, "trace_id": {"type": "string"}},
+            "properties": {"date": _STRING_SCHEMA, **_IDENTITY_PROPERTIES},
             "additionalProperties": False,
         },
     },
@@ -42,7 +73,7 @@ TOOL_SCHEMAS = [
         "description": "Get one quest by canonical quest_id.",
         "input_schema": {
             "type": "object",
-            "properties": {"quest_id": {"type": "string"}, "actor_id": {"type": "string"}, "trace_id": {"type": "string"}},
+            "properties": {"quest_id": _STRING_SCHEMA, **_IDENTITY_PROPERTIES},
             "required": ["quest_id"],
             "additionalProperties": False,
         },
@@ -53,19 +84,18 @@ TOOL_SCHEMAS = [
         "input_schema": {
             "type": "object",
             "properties": {
-                "quest_id": {"type": "string"},
+                "quest_id": _STRING_SCHEMA,
                 "tier": {"type": "string", "enum": ["P0", "P1", "P2", "P3"]},
                 "artifacts": {
                     "type": "array",
                     "items": {
                         "type": "object",
-                        "properties": {"ref": {"type": "string"}, "summary": {"type": "string"}},
+                        "properties": {"ref": _STRING_SCHEMA, "summary": _STRING_SCHEMA},
                         "required": ["ref"],
                         "additionalProperties": False,
                     },
                 },
-                "actor_id": {"type": "string"},
-                "trace_id": {"type": "string"},
+                **_IDENTITY_PROPERTIES,
             },
             "required": ["quest_id", "tier", "artifacts"],
             "additionalProperties": False,
@@ -76,7 +106,7 @@ TOOL_SCHEMAS = [
         "description": "Get current local scorecard.",
         "input_schema": {
             "type": "object",
-            "properties": {"actor_id": {"type": "string"}, "trace_id": {"type": "string"}},
+            "properties": {**_IDENTITY_PROPERTIES},
             "additionalProperties": False,
         },
     },
@@ -85,7 +115,7 @@ TOOL_SCHEMAS = [
         "description": "Get human, agent, and alignment profiles.",
         "input_schema": {
             "type": "object",
-            "properties": {"actor_id": {"type": "string"}, "trace_id": {"type": "string"}},
+            "properties": {**_IDENTITY_PROPERTIES},
             "additionalProperties": False,
         },
     },
@@ -96,8 +126,7 @@ TOOL_SCHEMAS = [
             "type": "object",
             "properties": {
                 "profile_patch": {"type": "object"},
-                "actor_id": {"type": "string"},
-                "trace_id": {"type": "string"},
+                **_IDENTITY_PROPERTIES,
             },
             "required": ["profile_patch"],
             "additionalProperties": False,
@@ -111,13 +140,12 @@ TOOL_SCHEMAS = [
             "properties": {
                 "severity": {"type": "string", "enum": ["info", "low", "medium", "high", "critical"]},
                 "component": {"type": "string", "enum": ["proofs", "planner", "api", "mcp", "telemetry", "quests", "docs", "other"]},
-                "title": {"type": "string"},
-                "summary": {"type": "string"},
-                "details": {"type": "string"},
+                "title": _STRING_SCHEMA,
+                "summary": _STRING_SCHEMA,
+                "details": _STRING_SCHEMA,
                 "links": {"type": "object"},
-                "tags": {"type": "array", "items": {"type": "string"}},
-                "actor_id": {"type": "string"},
-                "trace_id": {"type": "string"},
+                "tags": {"type": "array", "items": _STRING_SCHEMA},
+                **_IDENTITY_PROPERTIES,
             },
             "required": ["severity", "component", "title"],
             "additionalProperties": False,
@@ -128,161 +156,442 @@ TOOL_SCHEMAS = [
         "description": "Get feedback counts by severity/component.",
         "input_schema": {
             "type": "object",
-            "properties": {"range": {"type": "string"}, "actor_id": {"type": "string"}, "trace_id": {"type": "string"}},
+            "properties": {"range": _STRING_SCHEMA, **_IDENTITY_PROPERTIES},
             "additionalProperties": False,
         },
     },
 ]
 
 
+def _json_dumps(value: Any) -> bytes:
+    """Serialize `value` to compact UTF-8 JSON bytes; orjson and stdlib json produce the same bytes."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:  # orjson.JSONEncodeError, e.g. integers beyond 64 bits
+            pass
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or text; raises `json.JSONDecodeError` on bad input.
+
+    Always stdlib json: orjson silently turns integers beyond 64 bits into floats.
+    """
+
+    return json.loads(data)
+
+
+# TOOL_SCHEMAS and the server info are static, so their results are encoded once at import.
+TOOLS_LIST_RESULT_JSON = _json_dumps({"tools": TOOL_SCHEMAS})
+INITIALIZE_RESULT_JSON = _json_dumps({"server": "clawspa-mcp", "version": "0.1"})
+
+
 class MCPBridge:
-    """Thin API client that injects MCP source and actor identity headers."""
+    """Thin API client that injects MCP source and actor identity headers.
+
+    Connections to the runner API are kept alive and reused across calls; use
+    `close()` (or a `with` block) to release idle sockets when done.
+    """
 
     def __init__(self, api_base: str, *, allow_nonlocal: bool = False, actor_id: str = "mcp:unknown") -> None:
-        self.api_base = validate_api_base(api_base, allow_nonlocal=allow_nonlocal)
+        parsed = _parse_api_base(api_base, allow_nonlocal=allow_nonlocal)
+        self.api_base = api_base.rstrip("/")
         self.actor_id = actor_id
+        self._connection_class = HTTPSConnection if parsed.scheme == "https" else HTTPConnection
+        self._netloc = parsed.netloc
+        self._path_prefix = parsed.path.rstrip("/")
+        self._idle_connections: list[HTTPConnection] = []
+        self._pool_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
 
     def _new_trace_id(self) -> str:
-        return f"mcp:{uuid.uuid4()}"
+        # Same format as f"mcp:{uuid.uuid4()}" without constructing a UUID object.
+        raw = bytearray(os.urandom(16))
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        digest = raw.hex()
+        return f"mcp:{digest[:8]}-{digest[8:12]}-{digest[12:16]}-{digest[16:20]}-{digest[20:]}"
+
+    def _acquire_connection(self) -> tuple[HTTPConnection, bool]:
+        """Return `(connection, reused)`, preferring an idle keep-alive connection."""
+
+        with self._pool_lock:
+            if self._idle_connections:
+                return self._idle_connections.pop(), True
+        return self._connection_class(self._netloc, timeout=REQUEST_TIMEOUT_SECONDS), False
+
+    def _release_connection(self, connection: HTTPConnection) -> None:
+        with self._pool_lock:
+            if len(self._idle_connections) < MAX_IDLE_CONNECTIONS:
+                self._idle_connections.append(connection)
+                return
+        connection.close()
+
+    def _fanout_executor(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=len(PROFILE_PATHS), thread_name_prefix="clawspa-mcp")
+            return self._executor
+
+    def close(self) -> None:
+        """Close idle pooled connections and stop fan-out worker threads."""
+
+        with self._pool_lock:
+            idle, self._idle_connections = self._idle_connections, []
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for connection in idle:
+            connection.close()
+
+    def __enter__(self) -> MCPBridge:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _send(self, method: str, target: str, data: bytes | None, headers: dict[str, str]) -> tuple[int, bytes]:
+        connection, reused = self._acquire_connection()
+        try:
+            sent = False
+            try:
+                connection.request(method, target, body=data, headers=headers)
+                sent = True
+                response = connection.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                # The server dropped this idle keep-alive socket; retry once on a fresh one. Writes are only
+                # retried if request() itself failed, since the server may already have applied the body.
+                if not reused or (sent and method not in RETRYABLE_METHODS):
+                    raise
+                connection.close()
+                connection = self._connection_class(self._netloc, timeout=REQUEST_TIMEOUT_SECONDS)
+                connection.request(method, target, body=data, headers=headers)
+                response = connection.getresponse()
+            payload = response.read()
+        except (OSError, HTTPException) as exc:
+            connection.close()
+            raise RuntimeError(f"API request failed: {exc}") from exc
+        if response.will_close:
+            connection.close()
+        else:
+            self._release_connection(connection)
+        return response.status, payload
 
     def _request(
         self,
         method: str,
         path: str,
         params: dict[str, Any] | None = None,
-        body: dict[str, Any] | None = None,
+        body: dict[str, Any] | bytes | None = None,
         actor_id: str | None = None,
         trace_id: str | None = None,
     ) -> Any:
-        url = f"{self.api_base}{path}"
+        target = f"{self._path_prefix}{path}"
         if params:
-            url = f"{url}?{urlencode(params)}"
+            target = f"{target}?{urlencode(params)}"
         data = None
-        effective_actor_id = actor_id or self.actor_id
         headers = {
-            "Content-Type": "application/json",
-            "X-Clawspa-Source": "mcp",
-            "X-Clawspa-Actor": "agent",
-            "X-Clawspa-Actor-Id": effective_actor_id,
+            **STATIC_REQUEST_HEADERS,
+            "X-Clawspa-Actor-Id": actor_id or self.actor_id,
             "X-Clawspa-Trace-Id": trace_id or self._new_trace_id(),
         }
-        if body is not None:
-            data = json.dumps(body).encode("utf-8")
-        request = Request(url=url, method=method, headers=headers, data=data)
-        try:
-            with urlopen(request, timeout=10) as response:  # nosec B310
-                return json.loads(response.read().decode("utf-8"))
-        except HTTPError as exc:
-            detail = exc.read().decode("utf-8")
-            raise RuntimeError(f"API HTTP error {exc.code}: {detail}") from exc
-        except URLError as exc:
-            raise RuntimeError(f"API request failed: {exc}") from exc
+        if isinstance(body, bytes):
+            data = body
+        elif body is not None:
+            data = _json_dumps(body)
+        status, payload = self._send(method, target, data, headers)
+        if status >= 400:
+            detail = payload.decode("utf-8", errors="replace")
+            raise RuntimeError(f"API HTTP error {status}: {detail}")
+        return _json_loads(payload)
 
     def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
-        validate_tool_arguments(name, arguments)
+        encoded = _check_tool_arguments(name, arguments)
+        handler = self._TOOL_HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
         actor_id = arguments.get("actor_id") or self.actor_id
         trace_id = arguments.get("trace_id") or self._new_trace_id()
-        if name == "get_daily_quests":
-            target = arguments.get("date") or date.today().isoformat()
-            return self._request(
-                "GET",
-                "/v1/plans/daily",
-                params={"date": target},
-                actor_id=actor_id,
-                trace_id=trace_id,
-            )
-        if name == "get_quest":
-            return self._request("GET", f"/v1/quests/{arguments['quest_id']}", actor_id=actor_id, trace_id=trace_id)
-        if name == "submit_proof":
-            payload = {
-                "quest_id": arguments["quest_id"],
-                "tier": arguments["tier"],
-                "artifacts": arguments.get("artifacts", []),
-                "mode": "agent",
-                "actor_id": actor_id,
-            }
-            return self._request("POST", "/v1/proofs", body=payload, actor_id=actor_id, trace_id=trace_id)
-        if name == "get_scorecard":
-            return self._request("GET", "/v1/scorecard", actor_id=actor_id, trace_id=trace_id)
-        if name == "get_profiles":
-            return {
-                "human": self._request("GET", "/v1/profiles/human", actor_id=actor_id, trace_id=trace_id),
-                "agent": self._request("GET", "/v1/profiles/agent", actor_id=actor_id, trace_id=trace_id),
-                "alignment_snapshot": self._request(
-                    "GET",
-                    "/v1/profiles/alignment_snapshot",
-                    actor_id=actor_id,
-                    trace_id=trace_id,
-                ),
-            }
-        if name == "update_agent_profile":
-            current = self._request("GET", "/v1/profiles/agent", actor_id=actor_id, trace_id=trace_id)
-            merged = deep_merge(current, arguments.get("profile_patch", {}))
-            return self._request("PUT", "/v1/profiles/agent", body=merged, actor_id=actor_id, trace_id=trace_id)
-        if name == "submit_feedback":
-            payload = {
-                "severity": arguments["severity"],
-                "component": arguments["component"],
-                "title": arguments["title"],
-                "summary": arguments.get("summary", ""),
-                "details": arguments.get("details"),
-                "links": arguments.get("links", {}),
-                "tags": arguments.get("tags", []),
-                "actor_id": actor_id,
-            }
-            return self._request("POST", "/v1/feedback", body=payload, actor_id=actor_id, trace_id=trace_id)
-        if name == "get_feedback_summary":
-            params: dict[str, Any] = {"range": arguments.get("range", "7d")}
-            if arguments.get("actor_id"):
-                params["actor_id"] = arguments["actor_id"]
-            return self._request("GET", "/v1/feedback/summary", params=params, actor_id=actor_id, trace_id=trace_id)
-        raise ValueError(f"Unknown tool: {name}")
-
-
-def deep_merge(base: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
-    """Recursively merge `patch` into `base` without mutating the input mapping."""
-
-    merged = dict(base)
-    for key, value in patch.items():
-        if isinstance(value, dict) and isinstance(merged.get(key), dict):
-            merged[key] = deep_merge(merged[key], value)
-        else:
-            merged[key] = value
-    return merged
+        return handler(self, arguments, actor_id, trace_id, encoded)
+
+    def _get_daily_quests(self, arguments: dict[str, Any], actor_id: str, trace_id: str, encoded: bytes | None) -> Any:
+        target = arguments.get("date") or date.today().isoformat()
+        # `target` is validated YYYY-MM-DD (URL-safe), so skip urlencode for this hot path.
+        return self._request("GET", f"/v1/plans/daily?date={target}", actor_id=actor_id, trace_id=trace_id)
+
+    def _get_quest(self, arguments: dict[str, Any], actor_id: str, trace_id: str, encoded: bytes | None) -> Any:
+        return self._request("GET", f"/v1/quests/{arguments['quest_id']}", actor_id=actor_id, trace_id=trace_id)
+
+    def _submit_proof(self, arguments: dict[str, Any], actor_id: str, trace_id: str, encoded: bytes | None) -> Any:
+        payload = {
+            "quest_id": arguments["quest_id"],
+            "tier": arguments["tier"],
+            "artifacts": arguments.get("artifacts", []),
+            "mode": "agent",
+            "actor_id": actor_id,
+        }
+        return self._request("POST", "/v1/proofs", body=payload, actor_id=actor_id, trace_id=trace_id)
 
+    def _get_scorecard(self, arguments: dict[str, Any], actor_id: str, trace_id: str, encoded: bytes | None) -> Any:
+        return self._request("GET", "/v1/scorecard", actor_id=actor_id, trace_id=trace_id)
 
-def _validate_safe_text(value: str, *, field: str, max_length: int = MAX_STRING_LENGTH) -> None:
+    def _get_profiles(self, arguments: dict[str, Any], actor_id: str, trace_id: str, encoded: bytes | None) -> Any:
+        # The three profile reads are independent; overlap them so latency is ~one round trip.
+        executor = self._fanout_executor()
+        futures = {
+            key: executor.submit(self._request, "GET", path, actor_id=actor_id, trace_id=trace_id)
+            for key, path in PROFILE_PATHS.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+    def _update_agent_profile(self, arguments: dict[str, Any], actor_id: str, trace_id: str, encoded: bytes | None) -> Any:
+        # The runner merges server-side, saving the GET round trip and re-encoding the merged profile.
+        # `encoded` is the patch as already serialized by the size check in validation.
+        body = encoded if encoded is not None else arguments.get("profile_patch", {})
+        return self._request("PATCH", "/v1/profiles/agent", body=body, actor_id=actor_id, trace_id=trace_id)
+
+    def _submit_feedback(self, arguments: dict[str, Any], actor_id: str, trace_id: str, encoded: bytes | None) -> Any:
+        payload = {
+            "severity": arguments["severity"],
+            "component": arguments["component"],
+            "title": arguments["title"],
+            "summary": arguments.get("summary", ""),
+            "details": arguments.get("details"),
+            "links": arguments.get("links", {}),
+            "tags": arguments.get("tags", []),
+            "actor_id": actor_id,
+        }
+        return self._request("POST", "/v1/feedback", body=payload, actor_id=actor_id, trace_id=trace_id)
+
+    def _get_feedback_summary(self, arguments: dict[str, Any], actor_id: str, trace_id: str, encoded: bytes | None) -> Any:
+        params: dict[str, Any] = {"range": arguments.get("range", "7d")}
+        if arguments.get("actor_id"):
+            params["actor_id"] = arguments["actor_id"]
+        return self._request("GET", "/v1/feedback/summary", params=params, actor_id=actor_id, trace_id=trace_id)
+
+    _TOOL_HANDLERS: dict[str, Callable[[MCPBridge, dict[str, Any], str, str, bytes | None], Any]] = {
+        "get_daily_quests": _get_daily_quests,
+        "get_quest": _get_quest,
+        "submit_proof": _submit_proof,
+        "get_scorecard": _get_scorecard,
+        "get_profiles": _get_profiles,
+        "update_agent_profile": _update_agent_profile,
+        "submit_feedback": _submit_feedback,
+        "get_feedback_summary": _get_feedback_summary,
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_identifier(value: str) -> str | None:
+    """Memoized classification for short values reused across a session (actor_id, trace_id)."""
+
+    return classify_sensitive_text(value)
+
+
+def _validate_safe_text(
+    value: str,
+    *,
+    field: str,
+    max_length: int = MAX_STRING_LENGTH,
+    classify: Callable[[str], str | None] = classify_sensitive_text,
+) -> None:
     if len(value) > max_length:
         raise ValueError(f"{field} exceeds {max_length} characters.")
-    if payload_contains_secrets(value):
+    category = classify(value)
+    if category == "secret":
         raise ValueError(f"{field} appears to contain secret-like content.")
-    if payload_contains_pii(value):
+    if category == "pii":
         raise ValueError(f"{field} appears to contain PII-like content.")
-    if payload_requests_raw_logs(value):
+    if category == "raw_logs":
         raise ValueError(f"{field} appears to contain raw log text.")
 
 
-def _iter_strings(node: Any) -> list[str]:
-    if isinstance(node, str):
-        return [node]
-    if isinstance(node, list):
-        values: list[str] = []
-        for item in node:
-            values.extend(_iter_strings(item))
-        return values
-    if isinstance(node, dict):
-        values = []
-        for key, value in node.items():
-            if isinstance(key, str):
-                values.append(key)
-            values.extend(_iter_strings(value))
-        return values
-    return []
+def _iter_strings(node: Any) -> Iterator[str]:
+    """Yield string keys and values depth-first using an explicit stack instead of recursion."""
+
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            yield current
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+        elif isinstance(current, dict):
+            for key, value in reversed(current.items()):
+                stack.append(value)
+                if isinstance(key, str):
+                    stack.append(key)
+
+
+def _is_ascii_digits(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+def _is_date_shape(value: str) -> bool:
+    """Cheap `YYYY-MM-DD` shape check; `date.fromisoformat` still validates the calendar date."""
+
+    return (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and _is_ascii_digits(value[:4])
+        and _is_ascii_digits(value[5:7])
+        and _is_ascii_digits(value[8:])
+    )
+
+
+def _is_range(value: str) -> bool:
+    return len(value) > 1 and value[-1] in "dh" and _is_ascii_digits(value[:-1])
+
+
+def _validate_get_daily_quests(arguments: dict[str, Any]) -> None:
+    target = arguments.get("date")
+    if target is None:
+        return
+    if not isinstance(target, str) or not _is_date_shape(target):
+        raise ValueError("date must be YYYY-MM-DD.")
+    date.fromisoformat(target)
+
+
+def _validate_get_quest(arguments: dict[str, Any]) -> None:
+    quest_id = arguments.get("quest_id")
+    if not isinstance(quest_id, str) or not QUEST_ID_PATTERN.fullmatch(quest_id):
+        raise ValueError("quest_id must be a canonical quest identifier.")
+    _validate_safe_text(quest_id, field="quest_id", max_length=160)
+
+
+def _validate_submit_proof(arguments: dict[str, Any]) -> None:
+    quest_id = arguments.get("quest_id")
+    tier = arguments.get("tier")
+    artifacts = arguments.get("artifacts")
+    if not isinstance(quest_id, str) or not QUEST_ID_PATTERN.fullmatch(quest_id):
+        raise ValueError("quest_id must be a canonical quest identifier.")
+    if not isinstance(tier, str) or tier not in PROOF_TIERS:
+        raise ValueError("tier must be one of P0|P1|P2|P3.")
+    if not isinstance(artifacts, list):
+        raise ValueError("artifacts must be an array.")
+    if len(artifacts) > MAX_ARTIFACTS:
+        raise ValueError(f"artifacts exceeds max of {MAX_ARTIFACTS}.")
+    for idx, artifact in enumerate(artifacts):
+        if not isinstance(artifact, dict):
+            raise ValueError(f"artifacts[{idx}] must be an object.")
+        ref = artifact.get("ref")
+        normalized_ref = ref.strip() if isinstance(ref, str) else ""
+        if not normalized_ref:
+            raise ValueError(f"artifacts[{idx}].ref is required.")
+        if not ARTIFACT_REF_PATTERN.fullmatch(normalized_ref):
+            if "/" in normalized_ref or "\\" in normalized_ref:
+                raise ValueError(f"artifacts[{idx}].ref must not include path separators.")
+            raise ValueError(f"artifacts[{idx}].ref must be a short label (max {MAX_ARTIFACT_REF_CHARS} chars).")
+        # The pattern already caps the length, but still admits token/email/IP-shaped labels.
+        _validate_safe_text(normalized_ref, field=f"artifacts[{idx}].ref", max_length=MAX_ARTIFACT_REF_CHARS)
+        summary = artifact.get("summary")
+        if summary is not None:
+            if not isinstance(summary, str):
+                raise ValueError(f"artifacts[{idx}].summary must be a string.")
+            _validate_safe_text(summary, field=f"artifacts[{idx}].summary", max_length=MAX_ARTIFACT_SUMMARY_CHARS)
+
+
+def _validate_submit_feedback(arguments: dict[str, Any]) -> None:
+    severity = arguments.get("severity")
+    component = arguments.get("component")
+    title = arguments.get("title")
+    if not isinstance(severity, str) or severity not in FEEDBACK_SEVERITIES:
+        raise ValueError("severity must be one of info|low|medium|high|critical.")
+    if not isinstance(component, str) or component not in FEEDBACK_COMPONENTS:
+        raise ValueError("component must be one of proofs|planner|api|mcp|telemetry|quests|docs|other.")
+    if not isinstance(title, str) or not title.strip():
+        raise ValueError("title is required.")
+    _validate_safe_text(title, field="title", max_length=120)
+    summary = arguments.get("summary")
+    if summary is not None:
+        if not isinstance(summary, str):
+            raise ValueError("summary must be a string.")
+        _validate_safe_text(summary, field="summary", max_length=280)
+    details = arguments.get("details")
+    if details is not None:
+        if not isinstance(details, str):
+            raise ValueError("details must be a string.")
+        _validate_safe_text(details, field="details", max_length=4000)
+    links = arguments.get("links")
+    if links is not None:
+        if not isinstance(links, dict):
+            raise ValueError("links must be an object.")
+        for key, value in links.items():
+            if key not in FEEDBACK_LINK_KEYS:
+                raise ValueError("links keys must be quest_id|proof_id|endpoint|commit|pr.")
+            if not isinstance(value, str):
+                raise ValueError("links values must be strings.")
+            _validate_safe_text(value, field=f"links.{key}", max_length=200)
+    tags = arguments.get("tags")
+    if tags is not None:
+        if not isinstance(tags, list):
+            raise ValueError("tags must be an array.")
+        for idx, tag in enumerate(tags):
+            if not isinstance(tag, str):
+                raise ValueError(f"tags[{idx}] must be a string.")
+            _validate_safe_text(tag, field=f"tags[{idx}]", max_length=40)
+
+
+def _validate_get_feedback_summary(arguments: dict[str, Any]) -> None:
+    if any(key not in FEEDBACK_SUMMARY_ARGUMENT_KEYS for key in arguments):
+        raise ValueError("get_feedback_summary accepts range, actor_id, and trace_id only.")
+    range_value = arguments.get("range")
+    if range_value is not None:
+        if not isinstance(range_value, str) or not _is_range(range_value.strip().lower()):
+            raise ValueError("range must be like 7d or 24h.")
+
+
+def _validate_update_agent_profile(arguments: dict[str, Any]) -> bytes:
+    patch = arguments.get("profile_patch")
+    if not isinstance(patch, dict):
+        raise ValueError("profile_patch must be an object.")
+    try:
+        encoded = _json_dumps(patch)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("profile_patch must be JSON-serializable.") from exc
+    # `_json_dumps` emits the same UTF-8 bytes with or without orjson, so the limit is backend-independent.
+    if len(encoded) > MAX_PROFILE_PATCH_BYTES:
+        raise ValueError(f"profile_patch exceeds {MAX_PROFILE_PATCH_BYTES} bytes.")
+    strings = list(_iter_strings(patch))
+    # One scan over the newline-joined leaves clears a clean patch; newlines keep per-leaf word
+    # boundaries, so any leaf hit is also a joined hit. Only then re-check leaves for the error.
+    if any(len(value) > MAX_STRING_LENGTH for value in strings) or SENSITIVE_TEXT_PATTERN.search("\n".join(strings)):
+        for string_value in strings:
+            _validate_safe_text(string_value, field="profile_patch", max_length=MAX_STRING_LENGTH)
+    return encoded
+
+
+def _validate_no_arguments(name: str) -> Callable[[dict[str, Any]], None]:
+    def _validate(arguments: dict[str, Any]) -> None:
+        if any(key not in IDENTITY_ARGUMENT_KEYS for key in arguments):
+            raise ValueError(f"{name} does not accept arguments.")
+
+    return _validate
+
+
+# Validators may return the request body they had to serialize anyway, so the handler can send it as-is.
+_TOOL_VALIDATORS: dict[str, Callable[[dict[str, Any]], bytes | None]] = {
+    "get_daily_quests": _validate_get_daily_quests,
+    "get_quest": _validate_get_quest,
+    "submit_proof": _validate_submit_proof,
+    "get_scorecard": _validate_no_arguments("get_scorecard"),
+    "get_profiles": _validate_no_arguments("get_profiles"),
+    "update_agent_profile": _validate_update_agent_profile,
+    "submit_feedback": _validate_submit_feedback,
+    "get_feedback_summary": _validate_get_feedback_summary,
+}
 
 
 def validate_tool_arguments(name: str, arguments: dict[str, Any]) -> None:
     """Validate MCP tool arguments and reject secret/PII-like payloads."""
 
+    _check_tool_arguments(name, arguments)
+
+
+def _check_tool_arguments(name: str, arguments: dict[str, Any]) -> bytes | None:
     if not isinstance(arguments, dict):
         raise ValueError("Tool arguments must be an object.")
 
@@ -290,127 +599,26 @@ def validate_tool_arguments(name: str, arguments: dict[str, Any]) -> None:
     if actor_id is not None:
         if not isinstance(actor_id, str):
             raise ValueError("actor_id must be a string.")
-        _validate_safe_text(actor_id, field="actor_id", max_length=200)
+        _validate_safe_text(actor_id, field="actor_id", max_length=200, classify=_classify_identifier)
     trace_id = arguments.get("trace_id")
     if trace_id is not None:
         if not isinstance(trace_id, str):
             raise ValueError("trace_id must be a string.")
-        _validate_safe_text(trace_id, field="trace_id", max_length=200)
+        _validate_safe_text(trace_id, field="trace_id", max_length=200, classify=_classify_identifier)
+
+    validator = _TOOL_VALIDATORS.get(name)
+    if validator is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return validator(arguments)
 
-    if name == "get_daily_quests":
-        target = arguments.get("date")
-        if target is None:
-            return
-        if not isinstance(target, str) or not DATE_PATTERN.match(target):
-            raise ValueError("date must be YYYY-MM-DD.")
-        date.fromisoformat(target)
-        return
-    if name == "get_quest":
-        quest_id = arguments.get("quest_id")
-        if not isinstance(quest_id, str) or not QUEST_ID_PATTERN.match(quest_id):
-            raise ValueError("quest_id must be a canonical quest identifier.")
-        _validate_safe_text(quest_id, field="quest_id", max_length=160)
-        return
-    if name == "submit_proof":
-        quest_id = arguments.get("quest_id")
-        tier = arguments.get("tier")
-        artifacts = arguments.get("artifacts")
-        if not isinstance(quest_id, str) or not QUEST_ID_PATTERN.match(quest_id):
-            raise ValueError("quest_id must be a canonical quest identifier.")
-        if tier not in {"P0", "P1", "P2", "P3"}:
-            raise ValueError("tier must be one of P0|P1|P2|P3.")
-        if not isinstance(artifacts, list):
-            raise ValueError("artifacts must be an array.")
-        if len(artifacts) > MAX_ARTIFACTS:
-            raise ValueError(f"artifacts exceeds max of {MAX_ARTIFACTS}.")
-        for idx, artifact in enumerate(artifacts):
-            if not isinstance(artifact, dict):
-                raise ValueError(f"artifacts[{idx}] must be an object.")
-            ref = artifact.get("ref")
-            if not isinstance(ref, str) or not ref.strip():
-                raise ValueError(f"artifacts[{idx}].ref is required.")
-            normalized_ref = ref.strip()
-            if "/" in normalized_ref or "\\" in normalized_ref:
-                raise ValueError(f"artifacts[{idx}].ref must not include path separators.")
-            if len(normalized_ref) > MAX_ARTIFACT_REF_CHARS or not ARTIFACT_REF_PATTERN.match(normalized_ref):
-                raise ValueError(f"artifacts[{idx}].ref must be a short label (max {MAX_ARTIFACT_REF_CHARS} chars).")
-            _validate_safe_text(normalized_ref, field=f"artifacts[{idx}].ref", max_length=MAX_ARTIFACT_REF_CHARS)
-            summary = artifact.get("summary")
-            if summary is not None:
-                if not isinstance(summary, str):
-                    raise ValueError(f"artifacts[{idx}].summary must be a string.")
-                _validate_safe_text(summary, field=f"artifacts[{idx}].summary", max_length=MAX_ARTIFACT_SUMMARY_CHARS)
-        return
-    if name == "submit_feedback":
-        severity = arguments.get("severity")
-        component = arguments.get("component")
-        title = arguments.get("title")
-        if severity not in {"info", "low", "medium", "high", "critical"}:
-            raise ValueError("severity must be one of info|low|medium|high|critical.")
-        if component not in {"proofs", "planner", "api", "mcp", "telemetry", "quests", "docs", "other"}:
-            raise ValueError("component must be one of proofs|planner|api|mcp|telemetry|quests|docs|other.")
-        if not isinstance(title, str) or not title.strip():
-            raise ValueError("title is required.")
-        _validate_safe_text(title, field="title", max_length=120)
-        summary = arguments.get("summary")
-        if summary is not None:
-            if not isinstance(summary, str):
-                raise ValueError("summary must be a string.")
-            _validate_safe_text(summary, field="summary", max_length=280)
-        details = arguments.get("details")
-        if details is not None:
-            if not isinstance(details, str):
-                raise ValueError("details must be a string.")
-            _validate_safe_text(details, field="details", max_length=4000)
-        links = arguments.get("links")
-        if links is not None:
-            if not isinstance(links, dict):
-                raise ValueError("links must be an object.")
-            for key, value in links.items():
-                if key not in {"quest_id", "proof_id", "endpoint", "commit", "pr"}:
-                    raise ValueError("links keys must be quest_id|proof_id|endpoint|commit|pr.")
-                if not isinstance(value, str):
-                    raise ValueError("links values must be strings.")
-                _validate_safe_text(value, field=f"links.{key}", max_length=200)
-        tags = arguments.get("tags")
-        if tags is not None:
-            if not isinstance(tags, list):
-                raise ValueError("tags must be an array.")
-            for idx, tag in enumerate(tags):
-                if not isinstance(tag, str):
-                    raise ValueError(f"tags[{idx}] must be a string.")
-                _validate_safe_text(tag, field=f"tags[{idx}]", max_length=40)
-        return
-    if name == "get_feedback_summary":
-        allowed = {"range", "actor_id", "trace_id"}
-        if any(key not in allowed for key in arguments):
-            raise ValueError("get_feedback_summary accepts range, actor_id, and trace_id only.")
-        range_value = arguments.get("range")
-        if range_value is not None:
-            if not isinstance(range_value, str) or not re.match(r"^\d+[dh]$", range_value.strip().lower()):
-                raise ValueError("range must be like 7d or 24h.")
-        return
-    if name == "update_agent_profile":
-        patch = arguments.get("profile_patch")
-        if not isinstance(patch, dict):
-            raise ValueError("profile_patch must be an object.")
-        payload_bytes = len(json.dumps(patch).encode("utf-8"))
-        if payload_bytes > MAX_PROFILE_PATCH_BYTES:
-            raise ValueError(f"profile_patch exceeds {MAX_PROFILE_PATCH_BYTES} bytes.")
-        for string_value in _iter_strings(patch):
-            _validate_safe_text(string_value, field="profile_patch", max_length=MAX_STRING_LENGTH)
-        return
-    if name in {"get_scorecard", "get_profiles"}:
-        allowed = {"actor_id", "trace_id"}
-        if any(key not in allowed for key in arguments):
-            raise ValueError(f"{name} does not accept arguments.")
-        return
-    raise ValueError(f"Unknown tool: {name}")
 
+LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
 
+
+@functools.lru_cache(maxsize=64)
 def is_local_host(hostname: str) -> bool:
     normalized = hostname.strip().lower().rstrip(".")
-    if normalized == "localhost":
+    if normalized in LOOPBACK_HOSTS:
         return True
     try:
         return ipaddress.ip_address(normalized).is_loopback
@@ -421,6 +629,12 @@ def is_local_host(hostname: str) -> bool:
 def validate_api_base(api_base: str, *, allow_nonlocal: bool = False) -> str:
     """Validate runner API base URL with localhost-only default safety guard."""
 
+    _parse_api_base(api_base, allow_nonlocal=allow_nonlocal)
+    return api_base.rstrip("/")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_api_base(api_base: str, *, allow_nonlocal: bool = False) -> SplitResult:
     parsed = urlsplit(api_base)
     if parsed.scheme not in {"http", "https"}:
         raise ValueError("api-base must use http or https scheme.")
@@ -430,7 +644,10 @@ def validate_api_base(api_base: str, *, allow_nonlocal: bool = False) -> str:
         raise ValueError("api-base must include a host.")
     if not allow_nonlocal and not is_local_host(parsed.hostname):
         raise ValueError("api-base must target localhost by default. Use --allow-nonlocal to override.")
-    return api_base.rstrip("/")
+    return parsed
+
+
+_WRITE_LOCK = threading.Lock()
 
 
 def _write_response(response_id: Any, result: Any = None, error: str | None = None) -> None:
@@ -439,40 +656,98 @@ def _write_response(response_id: Any, result: Any = None, error: str | None = No
         payload["error"] = {"message": error}
     else:
         payload["result"] = result
-    sys.stdout.write(json.dumps(payload) + "\n")
-    sys.stdout.flush()
+    _emit(_json_dumps(payload) + b"\n")
 
 
-def serve_stdio(bridge: MCPBridge) -> int:
-    """Serve minimal MCP-style JSON-RPC requests over stdio."""
+def _write_encoded_result(response_id: Any, result_json: bytes) -> None:
+    _emit(b'{"id":' + _json_dumps(response_id) + b',"result":' + result_json + b"}\n")
 
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
-            _write_response(None, error="Invalid JSON input.")
-            continue
-
-        response_id = msg.get("id")
-        method = msg.get("method")
-        params = msg.get("params", {})
+
+def _emit(data: bytes) -> None:
+    """Write one framed response with a direct `os.write`, bypassing the text/buffer layers."""
+
+    stream = sys.stdout
+    with _WRITE_LOCK:
         try:
-            if method == "initialize":
-                _write_response(response_id, {"server": "clawspa-mcp", "version": "0.1"})
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            # Not backed by a file descriptor (e.g. redirected to an in-memory stream).
+            buffer = getattr(stream, "buffer", None)
+            if buffer is not None:
+                buffer.write(data)
+                buffer.flush()
+            else:
+                stream.write(data.decode("utf-8"))
+                stream.flush()
+            return
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+
+def _handle_tool_call(bridge: MCPBridge, response_id: Any, params: dict[str, Any]) -> None:
+    try:
+        name = params.get("name")
+        arguments = params.get("arguments", {})
+        result = bridge.call_tool(name, arguments)
+        _write_response(response_id, {"content": result})
+    except Exception as exc:  # noqa: BLE001
+        _write_response(response_id, error=str(exc))
+
+
+def serve_stdio(bridge: MCPBridge, *, max_inflight: int = 1) -> int:
+    """Serve minimal MCP-style JSON-RPC requests over stdio.
+
+    With `max_inflight > 1`, `tools/call` requests run on worker threads so slow
+    upstream calls overlap. Responses may then be written out of request order;
+    clients correlate them by `id`.
+    """
+
+    if max_inflight < 1:
+        raise ValueError("max_inflight must be at least 1.")
+    executor: ThreadPoolExecutor | None = None
+    if max_inflight > 1:
+        executor = ThreadPoolExecutor(max_workers=max_inflight, thread_name_prefix="clawspa-mcp-rpc")
+    slots = threading.BoundedSemaphore(max_inflight)
+
+    def _release_slot(_future: Any) -> None:
+        slots.release()
+
+    try:
+        # Read raw bytes: json.loads decodes UTF-8 bytes directly, so skip TextIOWrapper decoding.
+        for raw_line in sys.stdin.buffer:
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                msg = _json_loads(line)
+            except ValueError:  # JSONDecodeError or UnicodeDecodeError
+                _write_response(None, error="Invalid JSON input.")
+                continue
+            if not isinstance(msg, dict):
+                _write_response(None, error="JSON-RPC message must be an object.")
+                continue
+
+            response_id = msg.get("id")
+            method = msg.get("method")
+            params = msg.get("params", {})
+            if method == "tools/call":
+                if executor is None:
+                    _handle_tool_call(bridge, response_id, params)
+                else:
+                    # Bound in-flight work so a fast producer cannot queue unbounded calls.
+                    slots.acquire()
+                    executor.submit(_handle_tool_call, bridge, response_id, params).add_done_callback(_release_slot)
+            elif method == "initialize":
+                _write_encoded_result(response_id, INITIALIZE_RESULT_JSON)
             elif method == "tools/list":
-                _write_response(response_id, {"tools": TOOL_SCHEMAS})
-            elif method == "tools/call":
-                name = params.get("name")
-                arguments = params.get("arguments", {})
-                result = bridge.call_tool(name, arguments)
-                _write_response(response_id, {"content": result})
+                _write_encoded_result(response_id, TOOLS_LIST_RESULT_JSON)
             else:
                 _write_response(response_id, error=f"Unsupported method: {method}")
-        except Exception as exc:  # noqa: BLE001
-            _write_response(response_id, error=str(exc))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+        bridge.close()
     return 0
 
 
@@ -489,14 +764,22 @@ def main() -> int:
     parser.add_argument("--actor-id", default="mcp:unknown", help="Default actor id for MCP-originated calls.")
     parser.add_argument("--tool", help="Optional direct tool call mode.")
     parser.add_argument("--args-json", default="{}", help="Tool arguments in JSON.")
+    parser.add_argument(
+        "--max-inflight",
+        type=int,
+        default=1,
+        help="Max concurrent tools/call requests in stdio mode (>1 allows out-of-order responses).",
+    )
     args = parser.parse_args()
-
-    bridge = MCPBridge(api_base=args.api_base, allow_nonlocal=args.allow_nonlocal, actor_id=args.actor_id)
-    if args.tool:
-        tool_args = json.loads(args.args_json)
-        print(json.dumps(bridge.call_tool(args.tool, tool_args), indent=2))
-        return 0
-    return serve_stdio(bridge)
+    if args.max_inflight < 1:
+        parser.error("--max-inflight must be at least 1.")
+
+    with MCPBridge(api_base=args.api_base, allow_nonlocal=args.allow_nonlocal, actor_id=args.actor_id) as bridge:
+        if args.tool:
+            tool_args = json.loads(args.args_json)
+            print(json.dumps(bridge.call_tool(args.tool, tool_args), indent=2))
+            return 0
+        return serve_stdio(bridge, max_inflight=args.max_inflight)
 
 
 if __name__ == "__main__":
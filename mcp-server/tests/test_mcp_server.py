@@ -1,15 +1,39 @@
 from __future__ import annotations
 
+import io
+import json
+import sys
+import uuid
+from http.client import RemoteDisconnected
+from pathlib import Path
+from typing import Any
+
 import pytest
 
-from clawspa_mcp.server import MCPBridge, deep_merge, validate_api_base, validate_tool_arguments
+from clawspa_mcp.server import (
+    TOOL_SCHEMAS,
+    MCPBridge,
+    main,
+    serve_stdio,
+    validate_api_base,
+    validate_tool_arguments,
+)
+
 
+def test_iter_strings_yields_keys_and_values_depth_first() -> None:
+    from clawspa_mcp.server import _iter_strings
 
-def test_deep_merge_nested() -> None:
-    base = {"a": 1, "nested": {"x": 1, "y": 2}}
-    patch = {"nested": {"y": 9, "z": 3}}
-    merged = deep_merge(base, patch)
-    assert merged == {"a": 1, "nested": {"x": 1, "y": 9, "z": 3}}
+    patch = {"a": "one", "nested": {"b": ["two", {"c": "three"}], "n": 4}, "z": None}
+    assert list(_iter_strings(patch)) == ["a", "one", "nested", "b", "two", "c", "three", "n", "z"]
+
+
+def test_new_trace_id_is_prefixed_uuid4() -> None:
+    bridge = MCPBridge("http://127.0.0.1:8000")
+    trace_id = bridge._new_trace_id()
+    assert trace_id.startswith("mcp:")
+    parsed = uuid.UUID(trace_id[4:])
+    assert parsed.version == 4
+    assert str(parsed) == trace_id[4:]
 
 
 def test_tool_unknown_raises() -> None:
@@ -21,11 +45,24 @@ def test_tool_unknown_raises() -> None:
         assert True
 
 
+def test_tool_dispatch_covers_every_schema() -> None:
+    from clawspa_mcp.server import _TOOL_VALIDATORS
+
+    names = {schema["name"] for schema in TOOL_SCHEMAS}
+    assert set(MCPBridge._TOOL_HANDLERS) == names
+    assert set(_TOOL_VALIDATORS) == names
+
+
 def test_validate_api_base_localhost_allowed() -> None:
     value = validate_api_base("http://localhost:8000")
     assert value == "http://localhost:8000"
 
 
+@pytest.mark.parametrize("host", ["127.0.0.1", "[::1]", "LOCALHOST.", "127.8.9.10"])
+def test_validate_api_base_accepts_loopback_forms(host: str) -> None:
+    assert validate_api_base(f"http://{host}:8000/") == f"http://{host}:8000"
+
+
 def test_validate_api_base_nonlocal_rejected_by_default() -> None:
     with pytest.raises(ValueError, match="localhost"):
         validate_api_base("https://example.com")
@@ -51,6 +88,26 @@ def test_validate_tool_arguments_rejects_bad_date() -> None:
         validate_tool_arguments("get_daily_quests", {"date": "09-02-2026"})
 
 
+@pytest.mark.parametrize("value", ["2026-2-10", "2026-02-1x", "٢٠٢٦-02-10", "2026-02-10\n"])
+def test_validate_tool_arguments_rejects_malformed_date_shapes(value: str) -> None:
+    with pytest.raises(ValueError, match="YYYY-MM-DD"):
+        validate_tool_arguments("get_daily_quests", {"date": value})
+
+
+@pytest.mark.parametrize("value", ["d", "7", "7w", "-7d", "７d"])
+def test_validate_tool_arguments_rejects_bad_feedback_range(value: str) -> None:
+    with pytest.raises(ValueError, match="range must be"):
+        validate_tool_arguments("get_feedback_summary", {"range": value})
+    validate_tool_arguments("get_feedback_summary", {"range": " 24H "})
+
+
+def test_validate_tool_arguments_rejects_trailing_newline_identifiers() -> None:
+    with pytest.raises(ValueError, match="YYYY-MM-DD"):
+        validate_tool_arguments("get_daily_quests", {"date": "2026-02-10\n"})
+    with pytest.raises(ValueError, match="canonical quest identifier"):
+        validate_tool_arguments("get_quest", {"quest_id": "wellness.identity.anchor.mission_statement.v1\n"})
+
+
 def test_validate_tool_arguments_rejects_secret_like_submit_proof() -> None:
     with pytest.raises(ValueError, match="secret-like"):
         validate_tool_arguments(
@@ -75,6 +132,24 @@ def test_validate_tool_arguments_rejects_path_like_proof_ref() -> None:
         )
 
 
+@pytest.mark.parametrize(
+    ("ref", "message"),
+    [("r" * 129, "short label"), ("  ", "is required"), ("sk-abcdefghijklmnopqrst", "secret-like")],
+)
+def test_validate_tool_arguments_rejects_bad_proof_refs(ref: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        validate_tool_arguments(
+            "submit_proof",
+            {"quest_id": "wellness.identity.anchor.mission_statement.v1", "tier": "P1", "artifacts": [{"ref": ref}]},
+        )
+
+
+def test_validate_tool_arguments_rejects_secret_actor_id_on_repeat() -> None:
+    for _ in range(2):
+        with pytest.raises(ValueError, match="actor_id appears to contain secret-like"):
+            validate_tool_arguments("get_scorecard", {"actor_id": "sk-abcdefghijklmnop"})
+
+
 def test_validate_tool_arguments_rejects_large_profile_patch() -> None:
     large_patch = {"notes": "a" * 9000}
     with pytest.raises(ValueError, match="exceeds"):
@@ -86,6 +161,15 @@ def test_validate_tool_arguments_rejects_secret_profile_patch() -> None:
         validate_tool_arguments("update_agent_profile", {"profile_patch": {"token": "sk-abcdefghijklmnop"}})
 
 
+def test_validate_tool_arguments_profile_patch_leaf_checks() -> None:
+    # Adjacent clean leaves that only match once joined must still pass.
+    validate_tool_arguments("update_agent_profile", {"profile_patch": {"notes": ["paste your", "token"]}})
+    with pytest.raises(ValueError, match="PII-like"):
+        validate_tool_arguments("update_agent_profile", {"profile_patch": {"a": "calm", "b": ["ops@example.com"]}})
+    with pytest.raises(ValueError, match="exceeds 1024 characters"):
+        validate_tool_arguments("update_agent_profile", {"profile_patch": {"a": "x" * 1025}})
+
+
 def test_validate_tool_arguments_submit_feedback_rejects_secret_details() -> None:
     with pytest.raises(ValueError, match="secret-like"):
         validate_tool_arguments(
@@ -99,28 +183,55 @@ def test_validate_tool_arguments_submit_feedback_rejects_secret_details() -> Non
         )
 
 
-def test_mcp_request_sets_source_headers(monkeypatch: pytest.MonkeyPatch) -> None:
-    captured: dict[str, str] = {}
+class _DummyResponse:
+    status = 200
+    will_close = False
+
+    def read(self) -> bytes:
+        return b"{}"
+
+
+class _NotFoundResponse(_DummyResponse):
+    status = 404
+
+    def read(self) -> bytes:
+        return b'{"detail":"Pack not found"}'
+
 
-    class _DummyResponse:
-        def __enter__(self) -> "_DummyResponse":
-            return self
+def _fake_connection_class(
+    captured: dict[str, Any],
+    created: list[Any] | None = None,
+    response_class: type[_DummyResponse] = _DummyResponse,
+) -> type:
+    class _FakeConnection:
+        def __init__(self, netloc: str, timeout: float = 10) -> None:
+            self.netloc = netloc
+            if created is not None:
+                created.append(self)
 
-        def __exit__(self, exc_type, exc, tb) -> bool:
-            return False
+        def request(self, method: str, url: str, body: bytes | None = None, headers: dict[str, str] | None = None) -> None:
+            lowered = {key.lower(): value for key, value in (headers or {}).items()}
+            captured["method"] = method
+            captured["url"] = url
+            captured.setdefault("urls", []).append(url)
+            captured["source"] = lowered.get("x-clawspa-source")
+            captured["actor"] = lowered.get("x-clawspa-actor")
+            captured["actor_id"] = lowered.get("x-clawspa-actor-id")
+            captured["trace_id"] = lowered.get("x-clawspa-trace-id")
+            captured["body"] = body.decode("utf-8") if body is not None else None
 
-        def read(self) -> bytes:
-            return b"{}"
+        def getresponse(self) -> _DummyResponse:
+            return response_class()
 
-    def _fake_urlopen(request, timeout=10):  # noqa: ANN001
-        headers = {key.lower(): value for key, value in request.header_items()}
-        captured["source"] = headers.get("x-clawspa-source")
-        captured["actor"] = headers.get("x-clawspa-actor")
-        captured["actor_id"] = headers.get("x-clawspa-actor-id")
-        captured["trace_id"] = headers.get("x-clawspa-trace-id")
-        return _DummyResponse()
+        def close(self) -> None:
+            pass
 
-    monkeypatch.setattr("clawspa_mcp.server.urlopen", _fake_urlopen)
+    return _FakeConnection
+
+
+def test_mcp_request_sets_source_headers(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured))
     bridge = MCPBridge("http://127.0.0.1:8000", actor_id="openclaw:moltfred")
     bridge._request("GET", "/v1/health")
 
@@ -130,56 +241,34 @@ def test_mcp_request_sets_source_headers(monkeypatch: pytest.MonkeyPatch) -> Non
     assert captured["trace_id"].startswith("mcp:")
 
 
-def test_mcp_tool_actor_id_override(monkeypatch: pytest.MonkeyPatch) -> None:
-    captured: dict[str, str] = {}
-
-    class _DummyResponse:
-        def __enter__(self) -> "_DummyResponse":
-            return self
-
-        def __exit__(self, exc_type, exc, tb) -> bool:
-            return False
+def test_mcp_request_targets_host_with_base_path_prefix(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    created: list[Any] = []
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured, created))
+    bridge = MCPBridge("http://127.0.0.1:8000/runner/")
+    bridge._request("GET", "/v1/feedback/summary", params={"range": "7d"})
 
-        def read(self) -> bytes:
-            return b"{}"
+    assert created[0].netloc == "127.0.0.1:8000"
+    assert captured["url"] == "/runner/v1/feedback/summary?range=7d"
+    assert bridge.api_base == "http://127.0.0.1:8000/runner"
 
-    def _fake_urlopen(request, timeout=10):  # noqa: ANN001
-        headers = {key.lower(): value for key, value in request.header_items()}
-        captured["actor_id"] = headers.get("x-clawspa-actor-id")
-        captured["trace_id"] = headers.get("x-clawspa-trace-id")
-        return _DummyResponse()
 
-    monkeypatch.setattr("clawspa_mcp.server.urlopen", _fake_urlopen)
+def test_mcp_tool_actor_id_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured))
     bridge = MCPBridge("http://127.0.0.1:8000", actor_id="mcp:unknown")
     bridge.call_tool(
         "get_daily_quests",
         {"date": "2026-02-10", "actor_id": "openclaw:moltfred", "trace_id": "mcp:manual-trace"},
     )
+    assert captured["url"] == "/v1/plans/daily?date=2026-02-10"
     assert captured["actor_id"] == "openclaw:moltfred"
     assert captured["trace_id"] == "mcp:manual-trace"
 
 
 def test_mcp_submit_feedback_calls_feedback_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
-    captured: dict[str, str] = {}
-
-    class _DummyResponse:
-        def __enter__(self) -> "_DummyResponse":
-            return self
-
-        def __exit__(self, exc_type, exc, tb) -> bool:
-            return False
-
-        def read(self) -> bytes:
-            return b"{}"
-
-    def _fake_urlopen(request, timeout=10):  # noqa: ANN001
-        captured["url"] = request.full_url
-        headers = {key.lower(): value for key, value in request.header_items()}
-        captured["trace_id"] = headers.get("x-clawspa-trace-id")
-        captured["body"] = request.data.decode("utf-8")
-        return _DummyResponse()
-
-    monkeypatch.setattr("clawspa_mcp.server.urlopen", _fake_urlopen)
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured))
     bridge = MCPBridge("http://127.0.0.1:8000", actor_id="openclaw:moltfred")
     bridge.call_tool(
         "submit_feedback",
@@ -193,4 +282,307 @@ def test_mcp_submit_feedback_calls_feedback_endpoint(monkeypatch: pytest.MonkeyP
     )
     assert captured["url"].endswith("/v1/feedback")
     assert captured["trace_id"] == "mcp:feedback-test"
-    assert "\"component\": \"proofs\"" in captured["body"]
+    assert json.loads(captured["body"])["component"] == "proofs"
+
+
+def test_mcp_bridge_reuses_keep_alive_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    created: list[Any] = []
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured, created))
+    with MCPBridge("http://127.0.0.1:8000") as bridge:
+        bridge._request("GET", "/v1/health")
+        bridge._request("GET", "/v1/scorecard")
+        assert len(bridge._idle_connections) == 1
+    assert bridge._idle_connections == []
+
+    assert len(created) == 1
+    assert created[0].netloc == "127.0.0.1:8000"
+    assert captured["url"] == "/v1/scorecard"
+
+
+class _FailingConnection:
+    """Idle pooled connection whose next response read (or send, with `on_request`) raises `error`."""
+
+    def __init__(self, error: BaseException, *, on_request: bool = False) -> None:
+        self.error = error
+        self.on_request = on_request
+        self.requests: list[tuple[str, str]] = []
+        self.closed = False
+
+    def request(self, method: str, url: str, body: bytes | None = None, headers: dict[str, str] | None = None) -> None:
+        self.requests.append((method, url))
+        if self.on_request:
+            raise self.error
+
+    def getresponse(self) -> _DummyResponse:
+        raise self.error
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_mcp_bridge_retries_dropped_idle_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    created: list[Any] = []
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured, created))
+    bridge = MCPBridge("http://127.0.0.1:8000")
+    stale = _FailingConnection(RemoteDisconnected("Remote end closed connection without response"))
+    bridge._idle_connections.append(stale)
+
+    assert bridge._request("GET", "/v1/scorecard") == {}
+    assert stale.requests == [("GET", "/v1/scorecard")]
+    assert stale.closed is True
+    assert len(created) == 1
+    assert captured["urls"] == ["/v1/scorecard"]
+
+
+def test_mcp_bridge_does_not_resend_write_after_dropped_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    created: list[Any] = []
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured, created))
+    bridge = MCPBridge("http://127.0.0.1:8000")
+    stale = _FailingConnection(RemoteDisconnected("Remote end closed connection without response"))
+    bridge._idle_connections.append(stale)
+
+    with pytest.raises(RuntimeError, match="API request failed: Remote end closed"):
+        bridge._request("POST", "/v1/feedback", body={"title": "x"})
+    assert stale.requests == [("POST", "/v1/feedback")]
+    assert created == []
+
+
+def test_mcp_bridge_retries_write_when_send_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    created: list[Any] = []
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured, created))
+    bridge = MCPBridge("http://127.0.0.1:8000")
+    stale = _FailingConnection(BrokenPipeError("Broken pipe"), on_request=True)
+    bridge._idle_connections.append(stale)
+
+    assert bridge._request("PATCH", "/v1/profiles/agent", body={"notes": "x"}) == {}
+    assert len(created) == 1
+    assert captured["method"] == "PATCH"
+    assert captured["urls"] == ["/v1/profiles/agent"]
+
+
+def test_mcp_bridge_does_not_resend_timed_out_post(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    created: list[Any] = []
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured, created))
+    bridge = MCPBridge("http://127.0.0.1:8000")
+    slow = _FailingConnection(TimeoutError("timed out"))
+    bridge._idle_connections.append(slow)
+
+    with pytest.raises(RuntimeError, match="API request failed: timed out"):
+        bridge._request("POST", "/v1/proofs", body={"quest_id": "q"})
+    assert slow.requests == [("POST", "/v1/proofs")]
+    assert slow.closed is True
+    assert created == []
+    assert bridge._idle_connections == []
+
+
+def test_mcp_bridge_retries_once_when_every_idle_connection_is_stale(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    created: list[Any] = []
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured, created))
+    bridge = MCPBridge("http://127.0.0.1:8000")
+    stale = [_FailingConnection(ConnectionResetError("reset")) for _ in range(3)]
+    bridge._idle_connections.extend(stale)
+
+    bridge._request("GET", "/v1/scorecard")
+
+    assert [len(connection.requests) for connection in stale] == [0, 0, 1]
+    assert len(created) == 1
+    assert bridge._idle_connections == stale[:2] + created
+
+
+def test_mcp_bridge_releases_pooled_connection_on_http_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    created: list[Any] = []
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured, created, _NotFoundResponse))
+    with MCPBridge("http://127.0.0.1:8000") as bridge:
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="API HTTP error 404: .*Pack not found"):
+                bridge._request("GET", "/v1/packs/missing")
+        assert bridge._idle_connections == created
+
+    assert len(created) == 1
+    assert captured["urls"] == ["/v1/packs/missing", "/v1/packs/missing"]
+
+
+def test_mcp_get_profiles_fetches_all_profiles(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured))
+    bridge = MCPBridge("http://127.0.0.1:8000")
+    try:
+        result = bridge.call_tool("get_profiles", {"trace_id": "mcp:profiles-test"})
+    finally:
+        bridge.close()
+
+    assert set(result) == {"human", "agent", "alignment_snapshot"}
+    assert sorted(captured["urls"]) == [
+        "/v1/profiles/agent",
+        "/v1/profiles/alignment_snapshot",
+        "/v1/profiles/human",
+    ]
+
+
+class _EchoBridge:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        if name == "boom":
+            raise ValueError("Unknown tool: boom")
+        return {"tool": name, "arguments": arguments}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _run_stdio(monkeypatch: pytest.MonkeyPatch, lines: list[str | bytes], **kwargs: Any) -> list[dict[str, Any]]:
+    raw = b"".join((line if isinstance(line, bytes) else line.encode("utf-8")) + b"\n" for line in lines)
+    stdin = io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8")
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    monkeypatch.setattr(sys, "stdout", stdout)
+    bridge = _EchoBridge()
+    assert serve_stdio(bridge, **kwargs) == 0  # type: ignore[arg-type]
+    assert bridge.closed
+    return [json.loads(line) for line in stdout.buffer.getvalue().decode("utf-8").splitlines()]
+
+
+@pytest.mark.parametrize("max_inflight", [1, 4])
+def test_serve_stdio_answers_every_request(monkeypatch: pytest.MonkeyPatch, max_inflight: int) -> None:
+    lines = [
+        json.dumps({"id": 1, "method": "initialize"}),
+        "not json",
+        b"\xff\xfe not utf-8",
+        json.dumps({"id": 2, "method": "tools/call", "params": {"name": "get_scorecard", "arguments": {}}}),
+        json.dumps({"id": 3, "method": "tools/call", "params": {"name": "boom", "arguments": {}}}),
+        json.dumps({"id": 4, "method": "nope"}),
+        "[1, 2]",
+        json.dumps({"id": 5, "method": "tools/list"}),
+    ]
+    responses_list = _run_stdio(monkeypatch, lines, max_inflight=max_inflight)
+    responses = {item["id"]: item for item in responses_list}
+
+    assert responses[1]["result"]["server"] == "clawspa-mcp"
+    errors_without_id = sorted(item["error"]["message"] for item in responses_list if item["id"] is None)
+    assert errors_without_id == ["Invalid JSON input.", "Invalid JSON input.", "JSON-RPC message must be an object."]
+    assert responses[2]["result"]["content"]["tool"] == "get_scorecard"
+    assert "Unknown tool" in responses[3]["error"]["message"]
+    assert "Unsupported method" in responses[4]["error"]["message"]
+    assert len(responses[5]["result"]["tools"]) == len(TOOL_SCHEMAS)
+
+
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_main_rejects_non_positive_max_inflight(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], value: str
+) -> None:
+    monkeypatch.setattr(sys, "argv", ["clawspa-mcp", "--max-inflight", value])
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 2
+    assert "--max-inflight must be at least 1." in capsys.readouterr().err
+
+
+def test_write_response_uses_stdout_file_descriptor(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from clawspa_mcp.server import _write_response
+
+    out_file = tmp_path / "stdout.jsonl"
+    with out_file.open("w", encoding="utf-8") as stream:
+        monkeypatch.setattr(sys, "stdout", stream)
+        _write_response(7, {"ok": True})
+        _write_response(8, error="nope")
+
+    lines = out_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": 7, "result": {"ok": True}},
+        {"id": 8, "error": {"message": "nope"}},
+    ]
+
+
+def test_serve_stdio_writes_to_text_only_stdout(monkeypatch: pytest.MonkeyPatch) -> None:
+    raw = json.dumps({"id": 1, "method": "initialize"}).encode("utf-8") + b"\n"
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8"))
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    assert serve_stdio(_EchoBridge()) == 0  # type: ignore[arg-type]
+    assert json.loads(stdout.getvalue())["result"]["server"] == "clawspa-mcp"
+
+
+def test_serve_stdio_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("clawspa_mcp.server.orjson", None)
+    responses = _run_stdio(monkeypatch, [json.dumps({"id": 1, "method": "initialize"}), b"\xff bad"])
+
+    assert responses[0]["result"]["server"] == "clawspa-mcp"
+    assert responses[1]["error"]["message"] == "Invalid JSON input."
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_dumps_bytes_match_across_backends(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    from clawspa_mcp.server import _json_dumps
+
+    if not use_orjson:
+        monkeypatch.setattr("clawspa_mcp.server.orjson", None)
+    value = {"text": "caf\u00e9 \u2028", "big": 2**70, "nested": [1, None, True]}
+    expected = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    assert _json_dumps(value) == expected
+
+
+def test_serve_stdio_preserves_big_int_ids(monkeypatch: pytest.MonkeyPatch) -> None:
+    responses = _run_stdio(monkeypatch, [json.dumps({"id": 2**70 + 1, "method": "initialize"})])
+
+    assert responses[0]["id"] == 2**70 + 1
+
+
+def test_mcp_update_agent_profile_sends_patch_in_one_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured))
+    bridge = MCPBridge("http://127.0.0.1:8000")
+    bridge.call_tool("update_agent_profile", {"profile_patch": {"identity": {"display_name": "Moltfred"}}})
+
+    assert captured["urls"] == ["/v1/profiles/agent"]
+    assert captured["method"] == "PATCH"
+    assert json.loads(captured["body"]) == {"identity": {"display_name": "Moltfred"}}
+
+
+def test_mcp_update_agent_profile_accepts_big_int_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured))
+    bridge = MCPBridge("http://127.0.0.1:8000")
+    bridge.call_tool("update_agent_profile", {"profile_patch": {"identity": {"lucky_number": 2**70}}})
+
+    assert json.loads(captured["body"]) == {"identity": {"lucky_number": 2**70}}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_profile_patch_size_limit_counts_utf8_bytes(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr("clawspa_mcp.server.orjson", None)
+    accepted = {"a": "\u00e9" * 1000, "b": "\u00e9" * 1000}
+    validate_tool_arguments("update_agent_profile", {"profile_patch": accepted})
+
+    rejected = {key: "\u00e9" * 1000 for key in "abcde"}
+    with pytest.raises(ValueError, match="exceeds"):
+        validate_tool_arguments("update_agent_profile", {"profile_patch": rejected})
+
+
+def test_mcp_update_agent_profile_reuses_validated_encoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    encoded: list[Any] = []
+    from clawspa_mcp.server import _json_dumps as original_dumps
+
+    def _counting_dumps(value: Any) -> bytes:
+        encoded.append(value)
+        return original_dumps(value)
+
+    monkeypatch.setattr("clawspa_mcp.server.HTTPConnection", _fake_connection_class(captured))
+    monkeypatch.setattr("clawspa_mcp.server._json_dumps", _counting_dumps)
+    bridge = MCPBridge("http://127.0.0.1:8000")
+    patch = {"preferences": {"tone": "calm"}}
+    bridge.call_tool("update_agent_profile", {"profile_patch": patch})
+
+    assert encoded == [patch]
+    assert json.loads(captured["body"]) == patch
@@ -16,9 +16,17 @@ def main() -> int:
         action="store_true",
         help="Exit non-zero when WARN findings are present.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Lint quest files in this many worker processes (default: 1).",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
 
-    findings = lint_path(Path(args.path))
+    findings = lint_path(Path(args.path), jobs=args.jobs)
     has_error = any(item.severity == "ERROR" for item in findings)
     has_warn = any(item.severity == "WARN" for item in findings)
 
@@ -1,28 +1,59 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import mmap
+import os
 import re
+import sys
 import unicodedata
-from dataclasses import asdict, dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 from .pillars import discover_repo_root, load_canonical_pillars
 
 
 SEVERITY_ORDER = {"ERROR": 0, "WARN": 1, "INFO": 2}
-
-CADENCE_VALUES = {"daily", "weekly", "monthly", "ad-hoc"}
-MODE_VALUES = {"safe", "authorized"}
-RISK_VALUES = {"low", "medium", "high", "critical"}
-PROOF_TIER_VALUES = {"P0", "P1", "P2", "P3"}
-STEP_TYPES = {"read", "checklist", "reflect", "output", "link", "warn", "confirm", "runbook"}
+REQUIRED_QUEST_FIELDS = (
+    "id",
+    "title",
+    "summary",
+    "pillars",
+    "cadence",
+    "risk_level",
+    "mode",
+    "required_capabilities",
+    "steps",
+    "proof",
+    "scoring",
+)
+
+CADENCE_VALUES = frozenset({"daily", "weekly", "monthly", "ad-hoc"})
+MODE_VALUES = frozenset({"safe", "authorized"})
+RISK_VALUES = frozenset({"low", "medium", "high", "critical"})
+PROOF_TIER_VALUES = frozenset({"P0", "P1", "P2", "P3"})
+STEP_TYPES = frozenset({"read", "checklist", "reflect", "output", "link", "warn", "confirm", "runbook"})
+
+_CADENCE_HINT = f"Use one of: {sorted(CADENCE_VALUES)}"
+_MODE_HINT = f"Use one of: {sorted(MODE_VALUES)}"
+_RISK_HINT = f"Use one of: {sorted(RISK_VALUES)}"
+_PROOF_TIER_HINT = f"Use one of: {sorted(PROOF_TIER_VALUES)}"
+_STEP_TYPE_HINT = f"Use one of: {sorted(STEP_TYPES)}"
 
 RISKY_CAPABILITY_PREFIXES = ("exec:", "write:", "id:")
-RISKY_CAPABILITIES = {"net:scan_local", "net:scan_remote"}
+RISKY_CAPABILITIES = frozenset({"net:scan_local", "net:scan_remote"})
 
 SECRET_REQUEST_PATTERNS = [
     re.compile(pat, re.IGNORECASE)
@@ -100,6 +131,74 @@ SOCIAL_CONTAGION_PATTERNS = [
     ]
 ]
 
+
+def _alternation(patterns: list[re.Pattern[str]]) -> re.Pattern[str]:
+    return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+# (pattern, rule_id, severity, message, suggested_fix); each rule's list is one alternation, so a
+# string gets at most one finding per rule from a single search.
+CONTENT_RULES = [
+    (
+        _alternation(SECRET_REQUEST_PATTERNS),
+        "DATA-001",
+        "ERROR",
+        "Detected secret request language in quest content.",
+        "Replace with non-secret verification guidance.",
+    ),
+    (
+        _alternation(OVER_COLLECTION_PATTERNS),
+        "DATA-002",
+        "WARN",
+        "Potential over-collection language detected.",
+        "Request redacted summaries or metadata instead.",
+    ),
+    (
+        _alternation(BLIND_EXECUTION_PATTERNS),
+        "SEC-CONTENT-001",
+        "ERROR",
+        "Detected blind execution pattern.",
+        "Replace with reviewed runbook guidance and gating.",
+    ),
+    (
+        _alternation(REMOTE_CODE_PATTERNS),
+        "SEC-CONTENT-002",
+        "WARN",
+        "Detected unpinned install or remote code guidance.",
+        "Require pinned versions and provenance review.",
+    ),
+    (
+        _alternation(PERMISSION_ESCALATION_PATTERNS),
+        "SEC-CONTENT-003",
+        "WARN",
+        "Detected permission escalation cue.",
+        "Add approval gates and safer alternatives.",
+    ),
+    (
+        _alternation(INSTRUCTION_OVERRIDE_PATTERNS),
+        "INJECT-001",
+        "WARN",
+        "Detected instruction hierarchy override language.",
+        "Remove hierarchy-bypass phrasing.",
+    ),
+    (
+        _alternation(SOCIAL_CONTAGION_PATTERNS),
+        "INJECT-002",
+        "WARN",
+        "Detected social contagion instruction language.",
+        "Remove agent-to-agent propagation instructions.",
+    ),
+]
+
+# Every content rule in one alternation: clean strings (the common case) cost a single scan.
+CONTENT_PATTERN = _alternation([pattern for pattern, *_ in CONTENT_RULES])
+# ASCII case folding is much cheaper than Unicode folding. On ASCII text the two agree except that Unicode `\s`
+# also matches \x1c-\x1f, so strings containing those (or any non-ASCII) keep the Unicode prefilter.
+ASCII_CONTENT_PATTERN = re.compile(CONTENT_PATTERN.pattern, re.IGNORECASE | re.ASCII)
+_UNICODE_ONLY_SPACE_PATTERN = re.compile(r"[\x1c-\x1f]")
+# Shortest text any content rule can match ("full dm"); keep in sync when adding patterns.
+MIN_CONTENT_MATCH_LENGTH = 7
+
 HIDDEN_UNICODE_CONTROLS = {
     0x00AD,
     0x200B,
@@ -121,7 +220,7 @@ HIDDEN_UNICODE_CONTROLS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     rule_id: str
     severity: str
@@ -131,7 +230,14 @@ class Finding:
     suggested_fix: str
 
     def to_dict(self) -> dict[str, str]:
-        return asdict(self)
+        return {
+            "rule_id": self.rule_id,
+            "severity": self.severity,
+            "file": self.file,
+            "path": self.path,
+            "message": self.message,
+            "suggested_fix": self.suggested_fix,
+        }
 
 
 def _to_pointer(base: str, key: Any) -> str:
@@ -140,19 +246,20 @@ def _to_pointer(base: str, key: Any) -> str:
     return f"{base}.{key}" if base else f"$.{key}"
 
 
-def _iter_strings(node: Any, path: str = "$") -> list[tuple[str, str]]:
-    values: list[tuple[str, str]] = []
-    if isinstance(node, str):
-        values.append((path, node))
-        return values
-    if isinstance(node, list):
-        for idx, value in enumerate(node):
-            values.extend(_iter_strings(value, _to_pointer(path, idx)))
-        return values
-    if isinstance(node, dict):
-        for key, value in node.items():
-            values.extend(_iter_strings(value, _to_pointer(path, key)))
-    return values
+def _iter_strings(node: Any, path: str = "$") -> Iterator[tuple[str, str]]:
+    """Yield `(pointer, text)` for every string leaf, depth-first in document order."""
+
+    stack: list[tuple[str, Any]] = [(path, node)]
+    while stack:
+        current_path, current = stack.pop()
+        if isinstance(current, str):
+            yield current_path, current
+        elif isinstance(current, list):
+            for idx in range(len(current) - 1, -1, -1):
+                stack.append((_to_pointer(current_path, idx), current[idx]))
+        elif isinstance(current, dict):
+            for key, value in reversed(current.items()):
+                stack.append((_to_pointer(current_path, key), value))
 
 
 def _get(node: dict[str, Any], path: list[str], default: Any = None) -> Any:
@@ -181,26 +288,11 @@ def _has_confirm_step(human_steps: Any) -> bool:
     return False
 
 
-def _has_warn_or_stop_guidance(steps: dict[str, Any]) -> bool:
-    all_steps: list[dict[str, Any]] = []
-    for lane in ("human", "agent", "both"):
-        lane_steps = steps.get(lane, [])
-        if isinstance(lane_steps, list):
-            for item in lane_steps:
-                if isinstance(item, dict):
-                    all_steps.append(item)
-    for step in all_steps:
-        if step.get("type") == "warn":
-            return True
-        for _, text in _iter_strings(step, "$.step"):
-            lowered = text.lower()
-            if "stop" in lowered or "ask human" in lowered:
-                return True
-    return False
+_SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
 
 
 def _slugify(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+    return _SLUG_PATTERN.sub("_", value.lower()).strip("_")
 
 
 def _add(
@@ -217,7 +309,8 @@ def _add(
         Finding(
             rule_id=rule_id,
             severity=severity,
-            file=str(file).replace("\\", "/"),
+            # One shared string per file instead of a fresh copy per finding.
+            file=sys.intern(file.as_posix()),
             path=path,
             message=message,
             suggested_fix=suggested_fix,
@@ -250,465 +343,527 @@ def _scan_hidden_unicode(
                 )
 
 
-def _sha256_text_normalized(path: Path) -> str:
-    text = path.read_text(encoding="utf-8")
+# Checksum targets at least this large are hashed through mmap rather than read into memory.
+MMAP_MIN_BYTES = 1 << 20
+
+
+def _sha256_normalized(text: str) -> str:
     normalized = text.replace("\r\n", "\n").replace("\r", "\n")
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 
-def lint_path(target_path: str | Path, docs_dir: str | Path | None = None) -> list[Finding]:
-    target = Path(target_path).resolve()
-    if not target.exists():
-        raise FileNotFoundError(f"Path not found: {target}")
+def _sha256_text_normalized(path: Path) -> str:
+    # Same digest as `_sha256_normalized(path.read_text(...))` for UTF-8 files: CR never occurs
+    # inside a multi-byte sequence, so normalizing bytes skips the decode/encode round trip.
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size >= MMAP_MIN_BYTES:
+            # Large artifacts without CR hash straight from the page cache instead of a bytes copy.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped.find(b"\r") == -1:
+                    return hashlib.sha256(mapped).hexdigest()
+                data = mapped[:]
+        else:
+            data = handle.read()
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return hashlib.sha256(data).hexdigest()
 
-    if docs_dir:
-        docs = Path(docs_dir).resolve()
-    else:
-        repo_root = discover_repo_root(target)
-        docs = repo_root / "docs"
-    canonical_pillars = load_canonical_pillars(docs)
 
-    findings: list[Finding] = []
-    quest_files = sorted(p for p in target.rglob("*.quest.yaml") if p.is_file())
-    parsed_quests: dict[Path, dict[str, Any]] = {}
-    pack_by_quest: dict[Path, Path | None] = {}
-    quest_id_by_file: dict[Path, str] = {}
+@functools.lru_cache(maxsize=1024)
+def _sha256_file_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Digest keyed on stat metadata so unchanged files are not re-read across lint runs."""
 
-    for quest_file in quest_files:
-        pack_dir: Path | None = None
-        for parent in [quest_file.parent, *quest_file.parents]:
-            if (parent / "pack.yaml").exists():
-                pack_dir = parent
-                break
-        pack_by_quest[quest_file] = pack_dir
-        if pack_dir is None:
-            _add(
-                findings,
-                rule_id="PACK-001",
-                severity="ERROR",
-                file=quest_file,
-                path="$",
-                message="Quest file is not inside a pack directory with pack.yaml.",
-                suggested_fix="Add pack.yaml to the pack directory.",
-            )
+    return _sha256_text_normalized(Path(path))
+
+
+# Directory names never descended into while collecting lint targets, alongside any dot-directory.
+SKIP_DIR_NAMES = frozenset({"node_modules", "__pycache__", "dist", "build"})
 
+
+def _collect_lint_files(target: Path) -> tuple[list[Path], list[Path]]:
+    """Return sorted `(quest_files, pack_files)` under `target` from a single scandir walk."""
+
+    quest_files: list[Path] = []
+    pack_files: list[Path] = []
+    pending = [target]
+    while pending:
         try:
-            raw_text = quest_file.read_text(encoding="utf-8")
-            _scan_hidden_unicode(findings, file_path=quest_file, text=raw_text)
-            data = yaml.safe_load(raw_text)
-        except yaml.YAMLError as exc:
-            _add(
-                findings,
-                rule_id="SCHEMA-001",
-                severity="ERROR",
-                file=quest_file,
-                path="$",
-                message=f"YAML parse failure: {exc}",
-                suggested_fix="Fix YAML syntax.",
-            )
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not name.startswith(".") and name not in SKIP_DIR_NAMES:
+                            pending.append(Path(entry.path))
+                    elif name.endswith(".quest.yaml"):
+                        if entry.is_file():
+                            quest_files.append(Path(entry.path))
+                    elif name == "pack.yaml" and entry.is_file():
+                        pack_files.append(Path(entry.path))
+        except OSError:
             continue
+    quest_files.sort()
+    pack_files.sort()
+    return quest_files, pack_files
+
 
-        if not isinstance(data, dict):
+@dataclass
+class _QuestFileResult:
+    findings: list[Finding]
+    pack_dir: Path | None
+    quest_id: str | None = None
+    raw_text: str | None = None
+
+
+def _find_pack_dir(quest_file: Path, pack_for: dict[Path, Path | None]) -> Path | None:
+    """Nearest ancestor holding pack.yaml; `pack_for` memoizes every directory the walk visits."""
+
+    visited: list[Path] = []
+    pack_dir: Path | None = None
+    for parent in [quest_file.parent, *quest_file.parents]:
+        if parent in pack_for:
+            pack_dir = pack_for[parent]
+            break
+        visited.append(parent)
+        if (parent / "pack.yaml").exists():
+            pack_dir = parent
+            break
+    for directory in visited:
+        pack_for[directory] = pack_dir
+    return pack_dir
+
+
+def _lint_quest_file(quest_file: Path, pack_dir: Path | None, canonical_pillars: set[str]) -> _QuestFileResult:
+    """Lint one quest file in isolation; cross-file pack checks run afterwards in `lint_path`."""
+
+    findings: list[Finding] = []
+    result = _QuestFileResult(findings=findings, pack_dir=pack_dir)
+    if pack_dir is None:
+        _add(
+            findings,
+            rule_id="PACK-001",
+            severity="ERROR",
+            file=quest_file,
+            path="$",
+            message="Quest file is not inside a pack directory with pack.yaml.",
+            suggested_fix="Add pack.yaml to the pack directory.",
+        )
+
+    try:
+        raw_text = quest_file.read_text(encoding="utf-8")
+        result.raw_text = raw_text
+        _scan_hidden_unicode(findings, file_path=quest_file, text=raw_text)
+        data = yaml.load(raw_text, Loader=_SafeLoader)
+    except yaml.YAMLError as exc:
+        _add(
+            findings,
+            rule_id="SCHEMA-001",
+            severity="ERROR",
+            file=quest_file,
+            path="$",
+            message=f"YAML parse failure: {exc}",
+            suggested_fix="Fix YAML syntax.",
+        )
+        return result
+
+    if not isinstance(data, dict):
+        _add(
+            findings,
+            rule_id="SCHEMA-001",
+            severity="ERROR",
+            file=quest_file,
+            path="$",
+            message="Top-level YAML document must be an object.",
+            suggested_fix="Wrap quest content in a top-level mapping.",
+        )
+        return result
+
+    quest = data.get("quest")
+    if isinstance(quest, dict) and isinstance(quest.get("id"), str):
+        result.quest_id = quest["id"]
+
+    if data.get("schema_version") in (None, ""):
+        _add(
+            findings,
+            rule_id="SCHEMA-002",
+            severity="ERROR",
+            file=quest_file,
+            path="$.schema_version",
+            message="Missing required field: schema_version",
+            suggested_fix="Populate all required schema fields.",
+        )
+    quest_fields = quest if isinstance(quest, dict) else {}
+    for field in REQUIRED_QUEST_FIELDS:
+        if quest_fields.get(field) in (None, ""):
             _add(
                 findings,
-                rule_id="SCHEMA-001",
+                rule_id="SCHEMA-002",
                 severity="ERROR",
                 file=quest_file,
-                path="$",
-                message="Top-level YAML document must be an object.",
-                suggested_fix="Wrap quest content in a top-level mapping.",
+                path=f"$.quest.{field}",
+                message=f"Missing required field: quest.{field}",
+                suggested_fix="Populate all required schema fields.",
             )
-            continue
 
-        parsed_quests[quest_file] = data
-        quest = data.get("quest")
-        if isinstance(quest, dict) and isinstance(quest.get("id"), str):
-            quest_id_by_file[quest_file] = quest["id"]
-
-        required_fields = [
-            (["schema_version"], "$.schema_version"),
-            (["quest", "id"], "$.quest.id"),
-            (["quest", "title"], "$.quest.title"),
-            (["quest", "summary"], "$.quest.summary"),
-            (["quest", "pillars"], "$.quest.pillars"),
-            (["quest", "cadence"], "$.quest.cadence"),
-            (["quest", "risk_level"], "$.quest.risk_level"),
-            (["quest", "mode"], "$.quest.mode"),
-            (["quest", "required_capabilities"], "$.quest.required_capabilities"),
-            (["quest", "steps"], "$.quest.steps"),
-            (["quest", "proof"], "$.quest.proof"),
-            (["quest", "scoring"], "$.quest.scoring"),
-        ]
+    quest = data.get("quest", {})
+    cadence = quest.get("cadence")
+    if cadence is not None and cadence not in CADENCE_VALUES:
+        _add(
+            findings,
+            rule_id="SCHEMA-003",
+            severity="ERROR",
+            file=quest_file,
+            path="$.quest.cadence",
+            message=f"Invalid cadence value: {cadence}",
+            suggested_fix=_CADENCE_HINT,
+        )
+    mode = quest.get("mode")
+    if mode is not None and mode not in MODE_VALUES:
+        _add(
+            findings,
+            rule_id="SCHEMA-003",
+            severity="ERROR",
+            file=quest_file,
+            path="$.quest.mode",
+            message=f"Invalid mode value: {mode}",
+            suggested_fix=_MODE_HINT,
+        )
+    risk_level = quest.get("risk_level")
+    if risk_level is not None and risk_level not in RISK_VALUES:
+        _add(
+            findings,
+            rule_id="SCHEMA-003",
+            severity="ERROR",
+            file=quest_file,
+            path="$.quest.risk_level",
+            message=f"Invalid risk_level value: {risk_level}",
+            suggested_fix=_RISK_HINT,
+        )
+
+    proof_tier = _get(data, ["quest", "proof", "tier"])
+    if proof_tier is not None and proof_tier not in PROOF_TIER_VALUES:
+        _add(
+            findings,
+            rule_id="SCHEMA-003",
+            severity="ERROR",
+            file=quest_file,
+            path="$.quest.proof.tier",
+            message=f"Invalid proof tier value: {proof_tier}",
+            suggested_fix=_PROOF_TIER_HINT,
+        )
 
-        for path, ptr in required_fields:
-            value = _get(data, path, default=None)
-            if value in (None, ""):
+    steps = quest.get("steps", {})
+    has_warn_step = False
+    # Pointer prefixes of step mappings; their strings are checked for stop/ask-human guidance in the content scan.
+    step_pointer_prefixes: set[str] = set()
+    if isinstance(steps, dict):
+        for lane in ("human", "agent", "both"):
+            lane_steps = steps.get(lane, [])
+            if lane_steps is None:
+                continue
+            if isinstance(lane_steps, list):
+                for idx, step in enumerate(lane_steps):
+                    if isinstance(step, dict):
+                        step_pointer_prefixes.add(f"$.quest.steps.{lane}[{idx}].")
+                        step_type = step.get("type")
+                        if step_type == "warn":
+                            has_warn_step = True
+                        if step_type not in STEP_TYPES:
+                            _add(
+                                findings,
+                                rule_id="SCHEMA-003",
+                                severity="ERROR",
+                                file=quest_file,
+                                path=f"$.quest.steps.{lane}[{idx}].type",
+                                message=f"Invalid step type: {step_type}",
+                                suggested_fix=_STEP_TYPE_HINT,
+                            )
+
+    pillars = quest.get("pillars", [])
+    if isinstance(pillars, list):
+        for idx, pillar in enumerate(pillars):
+            if pillar not in canonical_pillars:
                 _add(
                     findings,
-                    rule_id="SCHEMA-002",
+                    rule_id="SCHEMA-004",
                     severity="ERROR",
                     file=quest_file,
-                    path=ptr,
-                    message=f"Missing required field: {'.'.join(path)}",
-                    suggested_fix="Populate all required schema fields.",
+                    path=f"$.quest.pillars[{idx}]",
+                    message=f"Unknown pillar: {pillar}",
+                    suggested_fix="Use canonical pillar names from docs/PILLARS.md.",
                 )
 
-        quest = data.get("quest", {})
-        cadence = quest.get("cadence")
-        if cadence is not None and cadence not in CADENCE_VALUES:
-            _add(
-                findings,
-                rule_id="SCHEMA-003",
-                severity="ERROR",
-                file=quest_file,
-                path="$.quest.cadence",
-                message=f"Invalid cadence value: {cadence}",
-                suggested_fix=f"Use one of: {sorted(CADENCE_VALUES)}",
-            )
-        mode = quest.get("mode")
-        if mode is not None and mode not in MODE_VALUES:
-            _add(
-                findings,
-                rule_id="SCHEMA-003",
-                severity="ERROR",
-                file=quest_file,
-                path="$.quest.mode",
-                message=f"Invalid mode value: {mode}",
-                suggested_fix=f"Use one of: {sorted(MODE_VALUES)}",
-            )
-        risk_level = quest.get("risk_level")
-        if risk_level is not None and risk_level not in RISK_VALUES:
-            _add(
-                findings,
-                rule_id="SCHEMA-003",
-                severity="ERROR",
-                file=quest_file,
-                path="$.quest.risk_level",
-                message=f"Invalid risk_level value: {risk_level}",
-                suggested_fix=f"Use one of: {sorted(RISK_VALUES)}",
-            )
-
-        proof_tier = _get(data, ["quest", "proof", "tier"])
-        if proof_tier is not None and proof_tier not in PROOF_TIER_VALUES:
-            _add(
-                findings,
-                rule_id="SCHEMA-003",
-                severity="ERROR",
-                file=quest_file,
-                path="$.quest.proof.tier",
-                message=f"Invalid proof tier value: {proof_tier}",
-                suggested_fix=f"Use one of: {sorted(PROOF_TIER_VALUES)}",
-            )
-
-        steps = quest.get("steps", {})
-        if isinstance(steps, dict):
-            for lane in ("human", "agent", "both"):
-                lane_steps = steps.get(lane, [])
-                if lane_steps is None:
-                    continue
-                if isinstance(lane_steps, list):
-                    for idx, step in enumerate(lane_steps):
-                        if isinstance(step, dict):
-                            step_type = step.get("type")
-                            if step_type not in STEP_TYPES:
-                                _add(
-                                    findings,
-                                    rule_id="SCHEMA-003",
-                                    severity="ERROR",
-                                    file=quest_file,
-                                    path=f"$.quest.steps.{lane}[{idx}].type",
-                                    message=f"Invalid step type: {step_type}",
-                                    suggested_fix=f"Use one of: {sorted(STEP_TYPES)}",
-                                )
-
-        pillars = quest.get("pillars", [])
-        if isinstance(pillars, list):
-            for idx, pillar in enumerate(pillars):
-                if pillar not in canonical_pillars:
-                    _add(
-                        findings,
-                        rule_id="SCHEMA-004",
-                        severity="ERROR",
-                        file=quest_file,
-                        path=f"$.quest.pillars[{idx}]",
-                        message=f"Unknown pillar: {pillar}",
-                        suggested_fix="Use canonical pillar names from docs/PILLARS.md.",
-                    )
-
-        required_capabilities = quest.get("required_capabilities", [])
-        if not isinstance(required_capabilities, list):
-            required_capabilities = []
+    required_capabilities = quest.get("required_capabilities", [])
+    if not isinstance(required_capabilities, list):
+        required_capabilities = []
+
+    if risk_level == "low" and mode and mode != "safe":
+        _add(
+            findings,
+            rule_id="MODE-001",
+            severity="ERROR",
+            file=quest_file,
+            path="$.quest.mode",
+            message="Low-risk quests must run in safe mode.",
+            suggested_fix="Set quest.mode to safe.",
+        )
 
-        if risk_level == "low" and mode and mode != "safe":
+    human_steps = _get(data, ["quest", "steps", "human"], default=[])
+    if mode == "authorized" and not _has_confirm_step(human_steps):
+        _add(
+            findings,
+            rule_id="MODE-002",
+            severity="ERROR",
+            file=quest_file,
+            path="$.quest.steps.human",
+            message="Authorized mode quests must include a human confirm step.",
+            suggested_fix="Add a confirm step to the human lane.",
+        )
+    if risk_level in {"high", "critical"}:
+        if not isinstance(human_steps, list) or not human_steps:
             _add(
                 findings,
-                rule_id="MODE-001",
+                rule_id="MODE-003",
                 severity="ERROR",
                 file=quest_file,
-                path="$.quest.mode",
-                message="Low-risk quests must run in safe mode.",
-                suggested_fix="Set quest.mode to safe.",
+                path="$.quest.steps.human",
+                message="High/critical risk quests must include human lane steps.",
+                suggested_fix="Add human lane steps with confirmation gate.",
             )
-
-        human_steps = _get(data, ["quest", "steps", "human"], default=[])
-        if mode == "authorized" and not _has_confirm_step(human_steps):
+        if not _has_confirm_step(human_steps):
             _add(
                 findings,
-                rule_id="MODE-002",
+                rule_id="MODE-003",
                 severity="ERROR",
                 file=quest_file,
                 path="$.quest.steps.human",
-                message="Authorized mode quests must include a human confirm step.",
-                suggested_fix="Add a confirm step to the human lane.",
+                message="High/critical risk quests must include explicit confirm step.",
+                suggested_fix="Add a confirm step in the human lane.",
             )
-        if risk_level in {"high", "critical"}:
-            if not isinstance(human_steps, list) or not human_steps:
-                _add(
-                    findings,
-                    rule_id="MODE-003",
-                    severity="ERROR",
-                    file=quest_file,
-                    path="$.quest.steps.human",
-                    message="High/critical risk quests must include human lane steps.",
-                    suggested_fix="Add human lane steps with confirmation gate.",
-                )
-            if not _has_confirm_step(human_steps):
+
+    if any(_is_risky_capability(cap) for cap in required_capabilities) and mode != "authorized":
+        _add(
+            findings,
+            rule_id="MODE-004",
+            severity="WARN",
+            file=quest_file,
+            path="$.quest.required_capabilities",
+            message="Risky capabilities usually require authorized mode.",
+            suggested_fix="Use mode: authorized or remove risky capabilities.",
+        )
+
+    proof = quest.get("proof", {})
+    proof_tier = proof.get("tier")
+    artifacts = proof.get("artifacts", [])
+    if proof_tier is None:
+        _add(
+            findings,
+            rule_id="PROOF-001",
+            severity="ERROR",
+            file=quest_file,
+            path="$.quest.proof",
+            message="Quest proof section must include tier.",
+            suggested_fix="Add proof.tier and proof.artifacts.",
+        )
+    if proof_tier != "P0" and (not isinstance(artifacts, list) or len(artifacts) == 0):
+        _add(
+            findings,
+            rule_id="PROOF-001",
+            severity="ERROR",
+            file=quest_file,
+            path="$.quest.proof.artifacts",
+            message="Non-P0 quests must define at least one artifact.",
+            suggested_fix="Declare required proof artifacts.",
+        )
+    if proof_tier in {"P2", "P3"} and isinstance(artifacts, list):
+        for idx, artifact in enumerate(artifacts):
+            if isinstance(artifact, dict) and not artifact.get("redaction_policy"):
                 _add(
                     findings,
-                    rule_id="MODE-003",
+                    rule_id="PROOF-002",
                     severity="ERROR",
                     file=quest_file,
-                    path="$.quest.steps.human",
-                    message="High/critical risk quests must include explicit confirm step.",
-                    suggested_fix="Add a confirm step in the human lane.",
+                    path=f"$.quest.proof.artifacts[{idx}]",
+                    message="P2/P3 artifacts require redaction_policy.",
+                    suggested_fix="Set artifact.redaction_policy (e.g., no-secrets).",
                 )
 
-        if any(_is_risky_capability(cap) for cap in required_capabilities) and mode != "authorized":
-            _add(
-                findings,
-                rule_id="MODE-004",
-                severity="WARN",
-                file=quest_file,
-                path="$.quest.required_capabilities",
-                message="Risky capabilities usually require authorized mode.",
-                suggested_fix="Use mode: authorized or remove risky capabilities.",
-            )
-
-        proof = quest.get("proof", {})
-        proof_tier = proof.get("tier")
-        artifacts = proof.get("artifacts", [])
-        if proof_tier is None:
-            _add(
-                findings,
-                rule_id="PROOF-001",
-                severity="ERROR",
-                file=quest_file,
-                path="$.quest.proof",
-                message="Quest proof section must include tier.",
-                suggested_fix="Add proof.tier and proof.artifacts.",
-            )
-        if proof_tier != "P0" and (not isinstance(artifacts, list) or len(artifacts) == 0):
-            _add(
-                findings,
-                rule_id="PROOF-001",
-                severity="ERROR",
-                file=quest_file,
-                path="$.quest.proof.artifacts",
-                message="Non-P0 quests must define at least one artifact.",
-                suggested_fix="Declare required proof artifacts.",
-            )
-        if proof_tier in {"P2", "P3"} and isinstance(artifacts, list):
-            for idx, artifact in enumerate(artifacts):
-                if isinstance(artifact, dict) and not artifact.get("redaction_policy"):
-                    _add(
-                        findings,
-                        rule_id="PROOF-002",
-                        severity="ERROR",
-                        file=quest_file,
-                        path=f"$.quest.proof.artifacts[{idx}]",
-                        message="P2/P3 artifacts require redaction_policy.",
-                        suggested_fix="Set artifact.redaction_policy (e.g., no-secrets).",
-                    )
-
-        scoring = quest.get("scoring", {})
-        proof_multiplier = scoring.get("proof_multiplier")
-        if not isinstance(proof_multiplier, dict):
+    scoring = quest.get("scoring", {})
+    proof_multiplier = scoring.get("proof_multiplier")
+    if not isinstance(proof_multiplier, dict):
+        _add(
+            findings,
+            rule_id="PROOF-003",
+            severity="ERROR",
+            file=quest_file,
+            path="$.quest.scoring.proof_multiplier",
+            message="Quest scoring must include proof_multiplier map with P0..P3 keys.",
+            suggested_fix="Define numeric multipliers for P0, P1, P2, and P3.",
+        )
+    else:
+        tiers = ("P0", "P1", "P2", "P3")
+        missing_tiers = [tier for tier in tiers if tier not in proof_multiplier]
+        if missing_tiers:
             _add(
                 findings,
                 rule_id="PROOF-003",
                 severity="ERROR",
                 file=quest_file,
                 path="$.quest.scoring.proof_multiplier",
-                message="Quest scoring must include proof_multiplier map with P0..P3 keys.",
-                suggested_fix="Define numeric multipliers for P0, P1, P2, and P3.",
+                message=f"proof_multiplier missing tiers: {missing_tiers}",
+                suggested_fix="Include numeric entries for P0, P1, P2, and P3.",
             )
         else:
-            tiers = ("P0", "P1", "P2", "P3")
-            missing_tiers = [tier for tier in tiers if tier not in proof_multiplier]
-            if missing_tiers:
+            try:
+                values = [float(proof_multiplier[tier]) for tier in tiers]
+            except (TypeError, ValueError):
                 _add(
                     findings,
                     rule_id="PROOF-003",
                     severity="ERROR",
                     file=quest_file,
                     path="$.quest.scoring.proof_multiplier",
-                    message=f"proof_multiplier missing tiers: {missing_tiers}",
-                    suggested_fix="Include numeric entries for P0, P1, P2, and P3.",
+                    message="proof_multiplier values must be numeric.",
+                    suggested_fix="Use numeric multiplier values such as 1.0, 1.2, 1.5, 1.5.",
                 )
             else:
-                try:
-                    values = [float(proof_multiplier[tier]) for tier in tiers]
-                except (TypeError, ValueError):
+                if values != sorted(values):
                     _add(
                         findings,
                         rule_id="PROOF-003",
                         severity="ERROR",
                         file=quest_file,
                         path="$.quest.scoring.proof_multiplier",
-                        message="proof_multiplier values must be numeric.",
-                        suggested_fix="Use numeric multiplier values such as 1.0, 1.2, 1.5, 1.5.",
-                    )
-                else:
-                    if values != sorted(values):
-                        _add(
-                            findings,
-                            rule_id="PROOF-003",
-                            severity="ERROR",
-                            file=quest_file,
-                            path="$.quest.scoring.proof_multiplier",
-                            message="proof_multiplier must be monotonic non-decreasing from P0 to P3.",
-                            suggested_fix="Adjust multipliers so P0 <= P1 <= P2 <= P3.",
-                        )
-
-        all_strings = _iter_strings(data)
-        for ptr, text in all_strings:
-            for pattern in SECRET_REQUEST_PATTERNS:
-                if pattern.search(text):
-                    _add(
-                        findings,
-                        rule_id="DATA-001",
-                        severity="ERROR",
-                        file=quest_file,
-                        path=ptr,
-                        message="Detected secret request language in quest content.",
-                        suggested_fix="Replace with non-secret verification guidance.",
-                    )
-                    break
-            for pattern in OVER_COLLECTION_PATTERNS:
-                if pattern.search(text):
-                    _add(
-                        findings,
-                        rule_id="DATA-002",
-                        severity="WARN",
-                        file=quest_file,
-                        path=ptr,
-                        message="Potential over-collection language detected.",
-                        suggested_fix="Request redacted summaries or metadata instead.",
-                    )
-                    break
-            for pattern in BLIND_EXECUTION_PATTERNS:
-                if pattern.search(text):
-                    _add(
-                        findings,
-                        rule_id="SEC-CONTENT-001",
-                        severity="ERROR",
-                        file=quest_file,
-                        path=ptr,
-                        message="Detected blind execution pattern.",
-                        suggested_fix="Replace with reviewed runbook guidance and gating.",
-                    )
-                    break
-            for pattern in REMOTE_CODE_PATTERNS:
-                if pattern.search(text):
-                    _add(
-                        findings,
-                        rule_id="SEC-CONTENT-002",
-                        severity="WARN",
-                        file=quest_file,
-                        path=ptr,
-                        message="Detected unpinned install or remote code guidance.",
-                        suggested_fix="Require pinned versions and provenance review.",
-                    )
-                    break
-            for pattern in PERMISSION_ESCALATION_PATTERNS:
-                if pattern.search(text):
-                    _add(
-                        findings,
-                        rule_id="SEC-CONTENT-003",
-                        severity="WARN",
-                        file=quest_file,
-                        path=ptr,
-                        message="Detected permission escalation cue.",
-                        suggested_fix="Add approval gates and safer alternatives.",
-                    )
-                    break
-            for pattern in INSTRUCTION_OVERRIDE_PATTERNS:
-                if pattern.search(text):
-                    _add(
-                        findings,
-                        rule_id="INJECT-001",
-                        severity="WARN",
-                        file=quest_file,
-                        path=ptr,
-                        message="Detected instruction hierarchy override language.",
-                        suggested_fix="Remove hierarchy-bypass phrasing.",
+                        message="proof_multiplier must be monotonic non-decreasing from P0 to P3.",
+                        suggested_fix="Adjust multipliers so P0 <= P1 <= P2 <= P3.",
                     )
-                    break
-            for pattern in SOCIAL_CONTAGION_PATTERNS:
-                if pattern.search(text):
+
+    # Quests repeat literals across pointers; scan each distinct string once and report it at every pointer.
+    pointers_by_text: dict[str, list[str]] = {}
+    for ptr, text in _iter_strings(data):
+        pointers_by_text.setdefault(text, []).append(ptr)
+    needs_stop_guidance = risk_level in {"medium", "high", "critical"} and isinstance(steps, dict) and not has_warn_step
+    has_stop_guidance = False
+    for text, pointers in pointers_by_text.items():
+        if needs_stop_guidance and not has_stop_guidance:
+            lowered = text.lower()
+            if ("stop" in lowered or "ask human" in lowered) and any(
+                ptr[: ptr.find("].") + 2] in step_pointer_prefixes for ptr in pointers
+            ):
+                has_stop_guidance = True
+        if len(text) < MIN_CONTENT_MATCH_LENGTH:
+            continue
+        if text.isascii() and _UNICODE_ONLY_SPACE_PATTERN.search(text) is None:
+            prefilter = ASCII_CONTENT_PATTERN
+        else:
+            prefilter = CONTENT_PATTERN
+        if prefilter.search(text) is None:
+            continue
+        for pattern, rule_id, severity, message, suggested_fix in CONTENT_RULES:
+            if pattern.search(text):
+                for ptr in pointers:
                     _add(
                         findings,
-                        rule_id="INJECT-002",
-                        severity="WARN",
+                        rule_id=rule_id,
+                        severity=severity,
                         file=quest_file,
                         path=ptr,
-                        message="Detected social contagion instruction language.",
-                        suggested_fix="Remove agent-to-agent propagation instructions.",
+                        message=message,
+                        suggested_fix=suggested_fix,
                     )
-                    break
 
-        tags = quest.get("tags", [])
-        if not isinstance(tags, list):
-            tags = []
-        if not any(isinstance(tag, str) and tag.lower().startswith("timebox:") for tag in tags):
-            _add(
-                findings,
-                rule_id="UX-001",
-                severity="WARN",
-                file=quest_file,
-                path="$.quest.tags",
-                message="Quest is missing timebox metadata.",
-                suggested_fix='Add a tag such as "timebox:5".',
-            )
+    tags = quest.get("tags", [])
+    if not isinstance(tags, list):
+        tags = []
+    if not any(isinstance(tag, str) and tag.lower().startswith("timebox:") for tag in tags):
+        _add(
+            findings,
+            rule_id="UX-001",
+            severity="WARN",
+            file=quest_file,
+            path="$.quest.tags",
+            message="Quest is missing timebox metadata.",
+            suggested_fix='Add a tag such as "timebox:5".',
+        )
 
-        total_steps = 0
-        if isinstance(steps, dict):
-            for lane in ("human", "agent", "both"):
-                lane_steps = steps.get(lane, [])
-                if isinstance(lane_steps, list):
-                    total_steps += len(lane_steps)
-        if total_steps > 12:
-            _add(
-                findings,
-                rule_id="UX-002",
-                severity="WARN",
-                file=quest_file,
-                path="$.quest.steps",
-                message=f"Quest has too many steps ({total_steps}).",
-                suggested_fix="Keep quests bite-sized (<= 12 steps).",
-            )
+    total_steps = 0
+    if isinstance(steps, dict):
+        for lane in ("human", "agent", "both"):
+            lane_steps = steps.get(lane, [])
+            if isinstance(lane_steps, list):
+                total_steps += len(lane_steps)
+    if total_steps > 12:
+        _add(
+            findings,
+            rule_id="UX-002",
+            severity="WARN",
+            file=quest_file,
+            path="$.quest.steps",
+            message=f"Quest has too many steps ({total_steps}).",
+            suggested_fix="Keep quests bite-sized (<= 12 steps).",
+        )
 
-        if risk_level in {"medium", "high", "critical"} and isinstance(steps, dict):
-            if not _has_warn_or_stop_guidance(steps):
-                _add(
-                    findings,
-                    rule_id="UX-003",
-                    severity="WARN",
-                    file=quest_file,
-                    path="$.quest.steps",
-                    message="Medium+ risk quest should include warn/stop guidance.",
-                    suggested_fix="Add a warn step or explicit stop/ask-human condition.",
+    if needs_stop_guidance and not has_stop_guidance:
+        _add(
+            findings,
+            rule_id="UX-003",
+            severity="WARN",
+            file=quest_file,
+            path="$.quest.steps",
+            message="Medium+ risk quest should include warn/stop guidance.",
+            suggested_fix="Add a warn step or explicit stop/ask-human condition.",
+        )
+    return result
+
+
+def lint_path(
+    target_path: str | Path,
+    docs_dir: str | Path | None = None,
+    *,
+    jobs: int = 1,
+) -> list[Finding]:
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1.")
+    target = Path(target_path).resolve()
+    if not target.exists():
+        raise FileNotFoundError(f"Path not found: {target}")
+
+    if docs_dir:
+        docs = Path(docs_dir).resolve()
+    else:
+        repo_root = discover_repo_root(target)
+        docs = repo_root / "docs"
+    canonical_pillars = load_canonical_pillars(docs)
+
+    findings: list[Finding] = []
+    quest_files, all_pack_files = _collect_lint_files(target)
+    pack_by_quest: dict[Path, Path | None] = {}
+    quest_id_by_file: dict[Path, str] = {}
+    quest_text_by_file: dict[Path, str] = {}
+    pack_for: dict[Path, Path | None] = {}
+    pack_dirs = [_find_pack_dir(quest_file, pack_for) for quest_file in quest_files]
+
+    if jobs > 1 and len(quest_files) > 1:
+        # Parsing and rule checks are CPU-bound Python, so fan files out to processes, not threads.
+        chunksize = max(1, len(quest_files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(
+                executor.map(
+                    _lint_quest_file, quest_files, pack_dirs, repeat(canonical_pillars), chunksize=chunksize
                 )
+            )
+    else:
+        results = [
+            _lint_quest_file(quest_file, pack_dir, canonical_pillars)
+            for quest_file, pack_dir in zip(quest_files, pack_dirs)
+        ]
+
+    for quest_file, result in zip(quest_files, results):
+        findings.extend(result.findings)
+        pack_by_quest[quest_file] = result.pack_dir
+        if result.quest_id is not None:
+            quest_id_by_file[quest_file] = result.quest_id
+        if result.raw_text is not None:
+            quest_text_by_file[quest_file] = result.raw_text
 
     pack_to_ids: dict[Path, dict[str, list[Path]]] = {}
     for quest_file, quest_id in quest_id_by_file.items():
@@ -717,8 +872,10 @@ def lint_path(target_path: str | Path, docs_dir: str | Path | None = None) -> li
             continue
         pack_to_ids.setdefault(pack_dir, {}).setdefault(quest_id, []).append(quest_file)
         filename = quest_file.name.lower()
+        if quest_id.lower() in filename:
+            continue
         slug = _slugify(quest_id)
-        if quest_id.lower() not in filename and slug not in filename:
+        if slug not in filename:
             _add(
                 findings,
                 rule_id="PACK-003",
@@ -729,7 +886,6 @@ def lint_path(target_path: str | Path, docs_dir: str | Path | None = None) -> li
                 suggested_fix=f"Rename file to include '{quest_id}' or '{slug}'.",
             )
 
-    all_pack_files = sorted(p for p in target.rglob("pack.yaml") if p.is_file())
     seen_pack_dirs = {pack_file.parent for pack_file in all_pack_files}
     for pack_dir in seen_pack_dirs:
         id_to_files = pack_to_ids.get(pack_dir, {})
@@ -750,7 +906,7 @@ def lint_path(target_path: str | Path, docs_dir: str | Path | None = None) -> li
         try:
             pack_raw = pack_file.read_text(encoding="utf-8")
             _scan_hidden_unicode(findings, file_path=pack_file, text=pack_raw)
-            pack_data = yaml.safe_load(pack_raw) or {}
+            pack_data = yaml.load(pack_raw, Loader=_SafeLoader) or {}
         except yaml.YAMLError as exc:
             _add(
                 findings,
@@ -787,7 +943,13 @@ def lint_path(target_path: str | Path, docs_dir: str | Path | None = None) -> li
                     suggested_fix="Update checksums.files to existing files.",
                 )
                 continue
-            actual = _sha256_text_normalized(file_path)
+            # Quest files were already read above; only other checksum targets touch the disk here.
+            cached_text = quest_text_by_file.get(file_path)
+            if cached_text is not None:
+                actual = _sha256_normalized(cached_text)
+            else:
+                stat = file_path.stat()
+                actual = _sha256_file_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
             if actual != str(expected):
                 _add(
                     findings,
@@ -799,8 +961,24 @@ def lint_path(target_path: str | Path, docs_dir: str | Path | None = None) -> li
                     suggested_fix="Recompute sha256 checksum in pack.yaml.",
                 )
 
-    findings.sort(key=lambda f: (SEVERITY_ORDER.get(f.severity, 99), f.file, f.rule_id, f.path))
-    return findings
+    return _sort_findings(findings)
+
+
+_FINDING_ORDER_KEY = attrgetter("file", "rule_id", "path")
+
+
+def _sort_findings(findings: list[Finding]) -> list[Finding]:
+    """Order by severity rank, then file/rule/path; bucketing by rank keeps the per-item key in C."""
+
+    by_rank: dict[int, list[Finding]] = {}
+    for finding in findings:
+        by_rank.setdefault(SEVERITY_ORDER.get(finding.severity, 99), []).append(finding)
+    ordered: list[Finding] = []
+    for rank in sorted(by_rank):
+        bucket = by_rank[rank]
+        bucket.sort(key=_FINDING_ORDER_KEY)
+        ordered.extend(bucket)
+    return ordered
 
 
 def findings_to_json(findings: list[Finding]) -> str:
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import functools
+import re
 from pathlib import Path
 
 
+# A "- " bullet, optionally indented; the captured rest of the line is stripped by the caller.
+_PILLAR_LINE_PATTERN = re.compile(r"^\s*- (.*)$", re.MULTILINE)
+
+
 def discover_repo_root(start: Path) -> Path:
-    current = start.resolve()
+    return _discover_repo_root(start.resolve())
+
+
+@functools.lru_cache(maxsize=32)
+def _discover_repo_root(current: Path) -> Path:
     for candidate in [current, *current.parents]:
         if (candidate / "docs").is_dir() and (candidate / "quests").is_dir():
             return candidate
@@ -16,11 +26,12 @@ def load_canonical_pillars(docs_dir: Path) -> set[str]:
     if not pillars_file.exists():
         raise FileNotFoundError(f"Missing pillars document: {pillars_file}")
 
-    pillars: set[str] = set()
-    for raw_line in pillars_file.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if line.startswith("- "):
-            value = line[2:].strip()
-            if value:
-                pillars.add(value)
-    return pillars
+    stat = pillars_file.stat()
+    return set(_load_canonical_pillars(pillars_file.resolve(), stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_canonical_pillars(pillars_file: Path, mtime_ns: int, size: int) -> frozenset[str]:
+    # Keyed on stat metadata so repeated lint runs skip the read until PILLARS.md changes.
+    text = pillars_file.read_text(encoding="utf-8")
+    return frozenset(value for match in _PILLAR_LINE_PATTERN.findall(text) if (value := match.strip()))
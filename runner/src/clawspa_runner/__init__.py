@@ -1,5 +1,20 @@
 """ClawSpa runner package."""
 
-from .service import RunnerService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .service import RunnerService
 
 __all__ = ["RunnerService"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the service lazily so light consumers (e.g. the MCP bridge importing
+    # `clawspa_runner.security`) do not pay for loading the full runner stack.
+    if name == "RunnerService":
+        from .service import RunnerService
+
+        return RunnerService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,16 +2,45 @@ from __future__ import annotations
 
 """HTTP API surface for local-first runner operations."""
 
+import itertools
+import json
+import os
 from datetime import date
-from typing import Any
+from typing import Any, NamedTuple
 from uuid import uuid4
 
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
 from .service import ProofSubmissionError, RunnerService
-from .telemetry import sanitize_actor_id
+from .telemetry import VALID_ACTOR_KINDS, VALID_SOURCES, sanitize_actor_id
+
+try:
+    import orjson  # noqa: F401 - FastAPI's ORJSONResponse encodes with it
+except ImportError:  # pragma: no cover - optional speedup, stdlib json fallback
+    _JSONResponse: type[JSONResponse] = JSONResponse
+else:
+
+    class _ORJSONResponse(ORJSONResponse):
+        """ORJSONResponse that falls back to stdlib json for values orjson rejects (ints beyond 64 bits)."""
+
+        def render(self, content: Any) -> bytes:
+            try:
+                return super().render(content)
+            except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+                return JSONResponse.render(self, content)
+
+    _JSONResponse = _ORJSONResponse
+
+
+class RequestContext(NamedTuple):
+    """Normalized caller identity and trace id resolved once per request."""
+
+    source: str
+    actor: str
+    actor_id: str
+    trace_id: str
 
 
 class ProofArtifact(BaseModel):
@@ -63,17 +92,61 @@ class FeedbackRequest(BaseModel):
     actor_id: str | None = Field(default=None, max_length=200)
 
 
+# Generated trace ids: a random per-process prefix plus a counter, so ids stay unique across restarts and
+# forked workers without drawing fresh randomness for every request.
+_TRACE_ID_PREFIX = f"api:{uuid4().hex[:16]}-"
+_TRACE_ID_COUNTER = itertools.count(1)
+
+
+def _reset_trace_ids() -> None:
+    global _TRACE_ID_PREFIX, _TRACE_ID_COUNTER
+    _TRACE_ID_PREFIX = f"api:{uuid4().hex[:16]}-"
+    _TRACE_ID_COUNTER = itertools.count(1)
+
+
+if hasattr(os, "register_at_fork"):  # Unix only; native Windows has no fork
+    os.register_at_fork(after_in_child=_reset_trace_ids)
+
+
+def _new_trace_id() -> str:
+    return f"{_TRACE_ID_PREFIX}{next(_TRACE_ID_COUNTER):x}"
+
+
+# `/v1/health` never changes, so its body is encoded once instead of per probe.
+_HEALTH_BODY = json.dumps(
+    {"status": "ok", "version": "0.1", "schema_versions": {"quest": "0.1", "profile": "0.1"}},
+    separators=(",", ":"),
+).encode("utf-8")
+
+# Constant part of the 500 body, in JSONResponse's compact rendering; only the trace id is encoded per error.
+_INTERNAL_ERROR_BODY_PREFIX = b'{"code":"INTERNAL_SERVER_ERROR","message":"Internal server error","trace_id":'
+
+
+def _internal_error_response(trace_id: str) -> Response:
+    body = _INTERNAL_ERROR_BODY_PREFIX + json.dumps(trace_id, ensure_ascii=False).encode("utf-8") + b"}"
+    return Response(content=body, status_code=500, media_type="application/json")
+
+
+def _normalized_choice(value: str, allowed: frozenset[str], fallback: str) -> str:
+    """Strip/lowercase `value` into `allowed`, else `fallback`; canonical values (the default) are returned as-is."""
+
+    if value in allowed:
+        return value
+    value = value.strip().lower()
+    return value if value in allowed else fallback
+
+
 def create_app(service: RunnerService) -> FastAPI:
     """Create API routes backed by `RunnerService` with actor/source attribution."""
 
-    app = FastAPI(title="ClawSpa Runner API", version="0.1")
+    app = FastAPI(title="ClawSpa Runner API", version="0.1", default_response_class=_JSONResponse)
 
     @app.middleware("http")
     async def trace_id_middleware(request: Request, call_next):  # type: ignore[no-untyped-def]
         incoming = (request.headers.get("x-clawspa-trace-id") or "").strip()
-        trace_id = sanitize_actor_id(incoming) if incoming else f"api:{uuid4()}"
+        trace_id = sanitize_actor_id(incoming) if incoming else _new_trace_id()
         if not trace_id or trace_id == "unknown":
-            trace_id = f"api:{uuid4()}"
+            trace_id = _new_trace_id()
         request.state.trace_id = trace_id
         try:
             response = await call_next(request)
@@ -90,14 +163,7 @@ def create_app(service: RunnerService) -> FastAPI:
                     "error_type": exc.__class__.__name__,
                 },
             )
-            response = JSONResponse(
-                status_code=500,
-                content={
-                    "code": "INTERNAL_SERVER_ERROR",
-                    "message": "Internal server error",
-                    "trace_id": trace_id,
-                },
-            )
+            response = _internal_error_response(trace_id)
         response.headers["X-Clawspa-Trace-Id"] = trace_id
         return response
 
@@ -105,29 +171,23 @@ def create_app(service: RunnerService) -> FastAPI:
         request: Request,
         default_actor: str = "human",
         body_actor_id: str | None = None,
-    ) -> tuple[str, str, str]:
-        """Resolve normalized `(source, actor_kind, actor_id)` with header precedence."""
+    ) -> RequestContext:
+        """Resolve normalized source, actor kind, actor id and trace id with header precedence."""
 
-        source = request.headers.get("x-clawspa-source", "api").strip().lower()
-        actor = request.headers.get("x-clawspa-actor", default_actor).strip().lower()
-        header_actor_id = (request.headers.get("x-clawspa-actor-id") or "").strip()
+        headers = request.headers
+        source = _normalized_choice(headers.get("x-clawspa-source", "api"), VALID_SOURCES, "api")
+        actor = _normalized_choice(headers.get("x-clawspa-actor", default_actor), VALID_ACTOR_KINDS, default_actor)
+        header_actor_id = (headers.get("x-clawspa-actor-id") or "").strip()
         body_actor_id_value = (body_actor_id or "").strip()
-        if source not in {"cli", "api", "mcp"}:
-            source = "api"
-        if actor not in {"human", "agent", "system"}:
-            actor = default_actor
         actor_id = header_actor_id or body_actor_id_value or f"{source}:unknown"
-        return source, actor, actor_id
-
-    def request_trace_id(request: Request) -> str:
-        value = getattr(request.state, "trace_id", None)
-        if isinstance(value, str) and value:
-            return value
-        return f"api:{uuid4()}"
+        trace_id = getattr(request.state, "trace_id", None)
+        if not isinstance(trace_id, str) or not trace_id:
+            trace_id = _new_trace_id()
+        return RequestContext(source, actor, actor_id, trace_id)
 
     @app.get("/v1/health")
-    def health() -> dict[str, Any]:
-        return {"status": "ok", "version": "0.1", "schema_versions": {"quest": "0.1", "profile": "0.1"}}
+    def health() -> Response:
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
     @app.get("/v1/packs")
     def list_packs() -> list[dict[str, Any]]:
@@ -172,14 +232,29 @@ def create_app(service: RunnerService) -> FastAPI:
     @app.put("/v1/profiles/human")
     def put_human_profile(profile: dict[str, Any], request: Request) -> dict[str, Any]:
         try:
-            source, actor, actor_id = request_context(request, default_actor="human")
+            source, actor, actor_id, trace_id = request_context(request, default_actor="human")
             return service.put_profile(
                 "human",
                 profile,
                 source=source,
                 actor=actor,
                 actor_id=actor_id,
-                trace_id=request_trace_id(request),
+                trace_id=trace_id,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    @app.patch("/v1/profiles/human")
+    def patch_human_profile(patch: dict[str, Any], request: Request) -> dict[str, Any]:
+        try:
+            source, actor, actor_id, trace_id = request_context(request, default_actor="human")
+            return service.patch_profile(
+                "human",
+                patch,
+                source=source,
+                actor=actor,
+                actor_id=actor_id,
+                trace_id=trace_id,
             )
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -191,14 +266,29 @@ def create_app(service: RunnerService) -> FastAPI:
     @app.put("/v1/profiles/agent")
     def put_agent_profile(profile: dict[str, Any], request: Request) -> dict[str, Any]:
         try:
-            source, actor, actor_id = request_context(request, default_actor="agent")
+            source, actor, actor_id, trace_id = request_context(request, default_actor="agent")
             return service.put_profile(
                 "agent",
                 profile,
                 source=source,
                 actor=actor,
                 actor_id=actor_id,
-                trace_id=request_trace_id(request),
+                trace_id=trace_id,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    @app.patch("/v1/profiles/agent")
+    def patch_agent_profile(patch: dict[str, Any], request: Request) -> dict[str, Any]:
+        try:
+            source, actor, actor_id, trace_id = request_context(request, default_actor="agent")
+            return service.patch_profile(
+                "agent",
+                patch,
+                source=source,
+                actor=actor,
+                actor_id=actor_id,
+                trace_id=trace_id,
             )
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -218,13 +308,13 @@ def create_app(service: RunnerService) -> FastAPI:
     ) -> dict[str, Any]:
         try:
             target = date_from_str(date)
-            source, actor, actor_id = request_context(request, default_actor="human")
+            source, actor, actor_id, trace_id = request_context(request, default_actor="human")
             return service.get_daily_plan(
                 target,
                 source=source,
                 actor=actor,
                 actor_id=actor_id,
-                trace_id=request_trace_id(request),
+                trace_id=trace_id,
             )
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -236,13 +326,13 @@ def create_app(service: RunnerService) -> FastAPI:
     ) -> dict[str, Any]:
         try:
             target = date_from_str(date)
-            source, actor, actor_id = request_context(request, default_actor="human")
+            source, actor, actor_id, trace_id = request_context(request, default_actor="human")
             return service.generate_daily_plan(
                 target,
                 source=source,
                 actor=actor,
                 actor_id=actor_id,
-                trace_id=request_trace_id(request),
+                trace_id=trace_id,
             )
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -254,13 +344,13 @@ def create_app(service: RunnerService) -> FastAPI:
     ) -> dict[str, Any]:
         try:
             target = date_from_str(date)
-            source, actor, actor_id = request_context(request, default_actor="human")
+            source, actor, actor_id, trace_id = request_context(request, default_actor="human")
             return service.get_weekly_plan(
                 target,
                 source=source,
                 actor=actor,
                 actor_id=actor_id,
-                trace_id=request_trace_id(request),
+                trace_id=trace_id,
             )
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -272,13 +362,13 @@ def create_app(service: RunnerService) -> FastAPI:
     ) -> dict[str, Any]:
         try:
             target = date_from_str(date)
-            source, actor, actor_id = request_context(request, default_actor="human")
+            source, actor, actor_id, trace_id = request_context(request, default_actor="human")
             return service.generate_weekly_plan(
                 target,
                 source=source,
                 actor=actor,
                 actor_id=actor_id,
-                trace_id=request_trace_id(request),
+                trace_id=trace_id,
             )
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -288,7 +378,7 @@ def create_app(service: RunnerService) -> FastAPI:
         artifact_rows = [{"ref": item.ref, "summary": item.summary} for item in request.artifacts]
         primary_artifact = ""
         try:
-            source, actor_kind, actor_id = request_context(
+            source, actor_kind, actor_id, trace_id = request_context(
                 http_request,
                 default_actor=request.mode if request.mode in {"human", "agent"} else "agent",
                 body_actor_id=request.actor_id,
@@ -301,10 +391,10 @@ def create_app(service: RunnerService) -> FastAPI:
                 artifacts=artifact_rows,
                 source=source,
                 actor_id=actor_id,
-                trace_id=request_trace_id(http_request),
+                trace_id=trace_id,
             )
         except ProofSubmissionError as exc:
-            return JSONResponse(status_code=400, content=exc.to_dict())
+            return _JSONResponse(status_code=400, content=exc.to_dict())
         except (ValueError, PermissionError) as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         except KeyError as exc:
@@ -320,7 +410,11 @@ def create_app(service: RunnerService) -> FastAPI:
     @app.post("/v1/feedback")
     def submit_feedback(request: FeedbackRequest, http_request: Request) -> dict[str, Any]:
         try:
-            source, actor, actor_id = request_context(http_request, default_actor="human", body_actor_id=request.actor_id)
+            source, actor, actor_id, trace_id = request_context(
+                http_request,
+                default_actor="human",
+                body_actor_id=request.actor_id,
+            )
             return service.add_feedback(
                 severity=request.severity,
                 component=request.component,
@@ -332,7 +426,7 @@ def create_app(service: RunnerService) -> FastAPI:
                 source=source,
                 actor=actor,
                 actor_id=actor_id,
-                trace_id=request_trace_id(http_request),
+                trace_id=trace_id,
             )
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -344,7 +438,7 @@ def create_app(service: RunnerService) -> FastAPI:
         limit: int = Query(100, ge=1, le=500),
     ) -> list[dict[str, Any]]:
         try:
-            return service.list_feedback(range_value=range, actor_id=actor_id, limit=min(limit, 100))
+            return service.list_feedback(range_value=range, actor_id=actor_id, limit=limit)
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -380,7 +474,11 @@ def create_app(service: RunnerService) -> FastAPI:
                 detail="Capability grant requires body confirm=true and header X-Clawspa-Confirm: true.",
             )
         try:
-            source, actor, actor_id = request_context(http_request, default_actor="human", body_actor_id=request.actor_id)
+            source, actor, actor_id, trace_id = request_context(
+                http_request,
+                default_actor="human",
+                body_actor_id=request.actor_id,
+            )
             return service.grant_capabilities_with_ticket(
                 capabilities=request.capabilities,
                 ttl_seconds=request.ttl_seconds,
@@ -389,7 +487,7 @@ def create_app(service: RunnerService) -> FastAPI:
                 source=source,
                 actor=actor,
                 actor_id=actor_id,
-                trace_id=request_trace_id(http_request),
+                trace_id=trace_id,
             )
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -397,14 +495,18 @@ def create_app(service: RunnerService) -> FastAPI:
     @app.post("/v1/capabilities/revoke")
     def revoke_capabilities(request: RevokeRequest, http_request: Request) -> dict[str, Any]:
         try:
-            source, actor, actor_id = request_context(http_request, default_actor="human", body_actor_id=request.actor_id)
+            source, actor, actor_id, trace_id = request_context(
+                http_request,
+                default_actor="human",
+                body_actor_id=request.actor_id,
+            )
             return service.revoke_capability(
                 grant_id=request.grant_id,
                 capability=request.capability,
                 source=source,
                 actor=actor,
                 actor_id=actor_id,
-                trace_id=request_trace_id(http_request),
+                trace_id=trace_id,
             )
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -0,0 +1,29 @@
+"""Mapping merge helper backing the runner's profile PATCH endpoints."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def deep_merge(base: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+    """Merge `patch` into `base` without mutating either input mapping.
+
+    Only mappings on the path to a patched key are copied; untouched subtrees are
+    shared with `base`.
+    """
+
+    merged = dict(base)
+    stack = [(merged, patch)]
+    while stack:
+        target, changes = stack.pop()
+        for key, value in changes.items():
+            # Leaf values (the bulk of most patches) skip the lookup of the value they replace.
+            if isinstance(value, dict):
+                current = target.get(key)
+                if isinstance(current, dict):
+                    copied = dict(current)
+                    target[key] = copied
+                    stack.append((copied, value))
+                    continue
+            target[key] = value
+    return merged
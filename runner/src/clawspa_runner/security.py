@@ -39,6 +39,25 @@ RAW_LOG_PATTERNS = [
 ]
 
 
+def _alternation(patterns: list[re.Pattern[str]]) -> re.Pattern[str]:
+    parts = []
+    for pattern in patterns:
+        source = pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            source = f"(?i:{source})"
+        parts.append(f"(?:{source})")
+    return re.compile("|".join(parts))
+
+
+# One combined scan over every detector; clean text (the common case) is rejected in a single pass.
+SENSITIVE_TEXT_PATTERN = _alternation(
+    [*SECRET_VALUE_PATTERNS, *SECRET_REQUEST_PATTERNS, *PII_PATTERNS, *RAW_LOG_PATTERNS]
+)
+
+# Shortest text any detector can match (IPv6-like "a:b:c"); keep in sync when adding patterns.
+MIN_SENSITIVE_TEXT_LENGTH = 5
+
+
 def is_secret_like_text(text: str) -> bool:
     for pattern in SECRET_VALUE_PATTERNS:
         if pattern.search(text):
@@ -53,6 +72,19 @@ def is_secret_request_text(text: str) -> bool:
     return False
 
 
+def classify_sensitive_text(text: str) -> str | None:
+    """Return the highest-priority match category (`secret`, `pii`, `raw_logs`) or None."""
+
+    if len(text) < MIN_SENSITIVE_TEXT_LENGTH or SENSITIVE_TEXT_PATTERN.search(text) is None:
+        return None
+    if is_secret_like_text(text) or is_secret_request_text(text):
+        return "secret"
+    for pattern in PII_PATTERNS:
+        if pattern.search(text):
+            return "pii"
+    return "raw_logs"
+
+
 def payload_contains_secrets(payload: Any) -> bool:
     if isinstance(payload, str):
         return is_secret_like_text(payload) or is_secret_request_text(payload)
@@ -16,7 +16,8 @@ from typing import Any
 
 from .paths import agent_home, ensure_home_dirs
 from .quests import QuestRepository
-from .security import payload_contains_pii, payload_contains_secrets, payload_requests_raw_logs
+from .merge import deep_merge
+from .security import classify_sensitive_text, payload_contains_pii, payload_contains_secrets
 from .telemetry import (
     TelemetryLogger,
     diff_aggregated_summaries,
@@ -1205,11 +1206,12 @@ class RunnerService:
         )
 
     def _validate_artifact_text(self, text: str, *, source: str) -> None:
-        if payload_contains_secrets(text):
+        category = classify_sensitive_text(text)
+        if category == "secret":
             raise ValueError(f"{source} appears to contain secret-like content.")
-        if payload_contains_pii(text):
+        if category == "pii":
             raise ValueError(f"{source} appears to contain PII-like content.")
-        if payload_requests_raw_logs(text):
+        if category == "raw_logs":
             raise ValueError(f"{source} appears to contain raw log content.")
 
     def _normalize_artifact_ref(self, raw_ref: str) -> str:
@@ -1789,7 +1791,7 @@ class RunnerService:
         actor_id: str | None = None,
         limit: int = MAX_FEEDBACK_ITEMS,
     ) -> list[dict[str, Any]]:
-        """List feedback rows filtered by time window and optional actor id."""
+        """List feedback rows filtered by time window and optional actor id (at most `MAX_FEEDBACK_ITEMS`)."""
 
         window = parse_range(range_value)
         cutoff = datetime.now(tz=UTC) - window
@@ -1807,7 +1809,7 @@ class RunnerService:
         items.sort(key=lambda item: str(item.get("ts", "")), reverse=True)
         if limit <= 0:
             return []
-        return items[:limit]
+        return items[: min(limit, MAX_FEEDBACK_ITEMS)]
 
     def feedback_summary(self, *, range_value: str = "30d", actor_id: str | None = None) -> dict[str, Any]:
         """Return aggregate feedback counts by severity/component plus top tags."""
@@ -2103,6 +2105,28 @@ class RunnerService:
         )
         return profile
 
+    def patch_profile(
+        self,
+        profile_kind: str,
+        patch: dict[str, Any],
+        *,
+        source: str = "cli",
+        actor: str | None = None,
+        actor_id: str | None = None,
+        trace_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Deep-merge `patch` into the stored profile and persist it via `put_profile`."""
+
+        merged = deep_merge(self.get_profile(profile_kind), patch)
+        return self.put_profile(
+            profile_kind,
+            merged,
+            source=source,
+            actor=actor,
+            actor_id=actor_id,
+            trace_id=trace_id,
+        )
+
     def generate_alignment_snapshot(self) -> dict[str, Any]:
         """Derive a lightweight alignment snapshot from human and agent profiles."""
 
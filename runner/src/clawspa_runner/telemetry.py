@@ -39,8 +39,8 @@ VALID_EVENT_TYPES = {
     "telemetry.purged",
     "trust_signal.updated",
 }
-VALID_ACTOR_KINDS = {"human", "agent", "system"}
-VALID_SOURCES = {"cli", "api", "mcp"}
+VALID_ACTOR_KINDS = frozenset({"human", "agent", "system"})
+VALID_SOURCES = frozenset({"cli", "api", "mcp"})
 MAX_STRING_LENGTH = 200
 RANGE_PATTERN = re.compile(r"^(\d+)([dh])$")
 GENESIS_PREV_HASH = "0" * 64
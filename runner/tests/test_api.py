@@ -4,9 +4,11 @@ import json
 import os
 from pathlib import Path
 
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
 from clawspa_runner.api import create_app
+from clawspa_runner.merge import deep_merge
 from clawspa_runner.service import RunnerService
 
 
@@ -76,6 +78,7 @@ def test_health_endpoint_exposes_versions(tmp_path: Path) -> None:
     _, client = _service_and_client(tmp_path)
     response = client.get("/v1/health")
     assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
     payload = response.json()
     assert payload["status"] == "ok"
     assert "version" in payload
@@ -124,6 +127,44 @@ def test_profiles_endpoints_get_put_and_alignment_snapshot(tmp_path: Path) -> No
     assert generated.json()["schema_version"] == "0.1"
 
 
+def test_profile_patch_deep_merges_into_stored_profile(tmp_path: Path) -> None:
+    _, client = _service_and_client(tmp_path)
+    before = client.get("/v1/profiles/agent").json()
+
+    patched = client.patch(
+        "/v1/profiles/agent",
+        json={"identity": {"display_name": "Moltfred"}},
+        headers={"X-Clawspa-Source": "mcp", "X-Clawspa-Actor": "agent"},
+    )
+    assert patched.status_code == 200
+    body = patched.json()
+    assert body["identity"]["display_name"] == "Moltfred"
+    for key, value in before["identity"].items():
+        if key != "display_name":
+            assert body["identity"][key] == value
+    assert client.get("/v1/profiles/agent").json()["identity"]["display_name"] == "Moltfred"
+
+    rejected = client.patch("/v1/profiles/agent", json={"notes": "sk-abcdefghijklmnop"})
+    assert rejected.status_code == 400
+
+
+def test_deep_merge_nested() -> None:
+    base = {"a": 1, "nested": {"x": 1, "y": 2}}
+    patch = {"nested": {"y": 9, "z": 3}}
+    merged = deep_merge(base, patch)
+    assert merged == {"a": 1, "nested": {"x": 1, "y": 9, "z": 3}}
+
+
+def test_deep_merge_copies_only_patched_paths() -> None:
+    base = {"touched": {"inner": {"x": 1}}, "untouched": {"y": 2}}
+    merged = deep_merge(base, {"touched": {"inner": {"x": 5}}})
+
+    assert merged == {"touched": {"inner": {"x": 5}}, "untouched": {"y": 2}}
+    assert base["touched"]["inner"]["x"] == 1
+    assert merged["untouched"] is base["untouched"]
+    assert merged["touched"] is not base["touched"]
+
+
 def test_capability_grant_requires_ticket_token(tmp_path: Path) -> None:
     _, client = _service_and_client(tmp_path)
     response = client.post(
@@ -358,6 +399,49 @@ def test_mcp_header_sets_event_source(tmp_path: Path) -> None:
     assert plan_events[-1]["actor"] == {"kind": "agent", "id": "openclaw:moltfred"}
 
 
+def test_api_responses_match_with_stdlib_json_fallback(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    service, client = _service_and_client(tmp_path)
+    monkeypatch.setattr("clawspa_runner.api._JSONResponse", JSONResponse)
+    fallback = TestClient(create_app(service))
+    for path in ("/v1/health", "/v1/packs", "/v1/plans/daily?date=2026-02-09"):
+        assert fallback.get(path).json() == client.get(path).json()
+
+
+def test_profile_with_int_beyond_64_bits_round_trips(tmp_path: Path) -> None:
+    _, client = _service_and_client(tmp_path)
+    profile = client.get("/v1/profiles/agent").json()
+    profile["identity"]["lucky_number"] = 2**70
+
+    updated = client.put("/v1/profiles/agent", json=profile)
+    assert updated.status_code == 200
+    assert updated.json()["identity"]["lucky_number"] == 2**70
+    assert client.get("/v1/profiles/agent").json()["identity"]["lucky_number"] == 2**70
+    patched = client.patch("/v1/profiles/agent", json={"identity": {"display_name": "Moltfred"}})
+    assert patched.status_code == 200
+    assert patched.json()["identity"]["lucky_number"] == 2**70
+
+
+def test_generated_trace_ids_are_unique_and_prefixed(tmp_path: Path) -> None:
+    _, client = _service_and_client(tmp_path)
+    seen = {client.get("/v1/health").headers["x-clawspa-trace-id"] for _ in range(5)}
+    assert len(seen) == 5
+    assert all(trace_id.startswith("api:") for trace_id in seen)
+    assert len({trace_id.rsplit("-", 1)[0] for trace_id in seen}) == 1
+
+
+def test_source_and_actor_headers_are_normalized_or_defaulted(tmp_path: Path) -> None:
+    _, client = _service_and_client(tmp_path)
+    for headers, expected in (
+        ({"X-Clawspa-Source": " MCP ", "X-Clawspa-Actor": "Agent"}, ("mcp", "agent")),
+        ({"X-Clawspa-Source": "bogus", "X-Clawspa-Actor": "robot"}, ("api", "human")),
+        ({}, ("api", "human")),
+    ):
+        response = client.post("/v1/plans/daily/generate", params={"date": "2026-02-10"}, headers=headers)
+        assert response.status_code == 200
+        event = [event for event in _events(tmp_path) if event.get("event_type") == "plan.generated"][-1]
+        assert (event["source"], event["actor"]["kind"]) == expected
+
+
 def test_trace_id_header_echo_and_telemetry_propagation(tmp_path: Path) -> None:
     _, client = _service_and_client(tmp_path)
     trace_id = "mcp:test-trace-id"
@@ -505,6 +589,28 @@ def test_proof_submission_tier_too_low_returns_structured_error(tmp_path: Path)
     assert data.get("provided_tier") == "P1"
 
 
+def test_unhandled_error_returns_structured_500_with_trace_id(tmp_path: Path) -> None:
+    service, _ = _service_and_client(tmp_path)
+    app = create_app(service)
+
+    @app.get("/boom")
+    def boom() -> None:
+        raise RuntimeError("boom")
+
+    client = TestClient(app)
+    trace_id = 'mcp:quote"back\\slash'
+    response = client.get("/boom", headers={"X-Clawspa-Trace-Id": trace_id})
+    assert response.status_code == 500
+    assert response.headers["content-type"] == "application/json"
+    echoed = response.headers["x-clawspa-trace-id"]
+    expected = JSONResponse(
+        status_code=500,
+        content={"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error", "trace_id": echoed},
+    )
+    assert response.content == expected.body
+    assert response.json()["trace_id"] == echoed
+
+
 def test_feedback_post_and_summary_emit_actor_trace_metadata(tmp_path: Path) -> None:
     _, client = _service_and_client(tmp_path)
     response = client.post(
@@ -5,7 +5,12 @@ import os
 from datetime import UTC, date, datetime
 from pathlib import Path
 
-from clawspa_runner.service import ProofSubmissionError, RunnerService
+from clawspa_runner.security import (
+    MIN_SENSITIVE_TEXT_LENGTH,
+    SENSITIVE_TEXT_PATTERN,
+    classify_sensitive_text,
+)
+from clawspa_runner.service import MAX_FEEDBACK_ITEMS, ProofSubmissionError, RunnerService
 
 
 def _repo_root() -> Path:
@@ -380,6 +385,17 @@ def test_feedback_add_appends_jsonl_and_redacts_secret_details(tmp_path: Path) -
     assert rows[0]["actor"]["id"] == "openclaw:moltfred"
 
 
+def test_feedback_list_caps_large_limits(tmp_path: Path) -> None:
+    os.environ["AGENTWELLNESS_HOME"] = str(tmp_path / "home")
+    service = RunnerService.create(_repo_root())
+    now = datetime.now(tz=UTC).isoformat()
+    rows = [{"feedback_id": f"fb-{index}", "ts": now} for index in range(MAX_FEEDBACK_ITEMS + 5)]
+    service.feedback_path.parent.mkdir(parents=True, exist_ok=True)
+    service.feedback_path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+    assert len(service.list_feedback(range_value="7d", limit=500)) == MAX_FEEDBACK_ITEMS
+    assert len(service.list_feedback(range_value="7d", limit=3)) == 3
+
+
 def test_proof_ref_rejects_path_separators(tmp_path: Path) -> None:
     os.environ["AGENTWELLNESS_HOME"] = str(tmp_path / "home")
     service = RunnerService.create(_repo_root())
@@ -393,3 +409,23 @@ def test_proof_ref_rejects_path_separators(tmp_path: Path) -> None:
         assert False, "Expected ProofSubmissionError for invalid ref"
     except ProofSubmissionError as exc:
         assert exc.code == "PROOF_REF_INVALID"
+
+
+def test_classify_sensitive_text_prefers_secret_over_later_pii() -> None:
+    assert classify_sensitive_text("short ref guidance helped") is None
+    assert classify_sensitive_text("mail ops@example.com then sk-abcdefghijklmnop") == "secret"
+    assert classify_sensitive_text("Paste your API key here") == "secret"
+    assert classify_sensitive_text("reach me at ops@example.com") == "pii"
+    assert classify_sensitive_text("attach the FULL LOGS") == "raw_logs"
+
+
+def test_min_sensitive_text_length_matches_shortest_detector() -> None:
+    # Shortest hits per detector family; "1:2:3" (IPv6-like) is the shortest of all.
+    shortest_hits = ["1:2:3", "a@b.cc", "1.2.3.4", "raw log"]
+    assert min(len(text) for text in shortest_hits) == MIN_SENSITIVE_TEXT_LENGTH
+    for text in shortest_hits:
+        assert SENSITIVE_TEXT_PATTERN.search(text)
+        for start in range(len(text) - MIN_SENSITIVE_TEXT_LENGTH + 2):
+            assert SENSITIVE_TEXT_PATTERN.search(text[start : start + MIN_SENSITIVE_TEXT_LENGTH - 1]) is None
+    assert classify_sensitive_text("1:2:3") == "pii"
+    assert classify_sensitive_text("P0") is None